@@ -72,6 +72,9 @@ class PromptPilotBackend:
         self.settings_file = SETTINGS_FILE
         self._init_files()
         self.client = None
+        # Werden bei jedem Schreiben erhöht, damit Aufrufer gelesene Listen cachen können
+        self.presets_version = 0
+        self.credentials_version = 0
 
     def _init_files(self):
         os.makedirs(os.path.dirname(self.preset_file) or ".", exist_ok=True)
@@ -179,11 +182,16 @@ class PromptPilotBackend:
         except Exception:
             return []
 
+    def _write_presets(self, presets: List[Dict]) -> None:
+        """Schreibt die Presets in die JSON-Datei und erhöht presets_version"""
+        with open(self.preset_file, 'w') as f:
+            json.dump(presets, f, indent=2)
+        self.presets_version += 1
+
     def save_presets(self) -> bool:
         """Speichert die Presets-Liste in die JSON-Datei"""
         try:
-            with open(self.preset_file, 'w') as f:
-                json.dump(self.presets, f, indent=2)
+            self._write_presets(self.presets)
             return True
         except Exception:
             return False
@@ -207,8 +215,7 @@ class PromptPilotBackend:
                 "model": model,
             })
 
-            with open(self.preset_file, 'w') as f:
-                json.dump(presets, f, indent=2)
+            self._write_presets(presets)
             return True
         except Exception:
             return False
@@ -227,8 +234,7 @@ class PromptPilotBackend:
                     presets[index]["shortcut"] = shortcut
                 else:
                     presets[index].pop("shortcut", None)
-                with open(self.preset_file, 'w') as f:
-                    json.dump(presets, f, indent=2)
+                self._write_presets(presets)
                 return True
             return False
         except Exception:
@@ -240,8 +246,7 @@ class PromptPilotBackend:
             presets = self.presets
             if 0 <= index < len(presets):
                 presets.pop(index)
-                with open(self.preset_file, 'w') as f:
-                    json.dump(presets, f, indent=2)
+                self._write_presets(presets)
                 return True
             return False
         except Exception:
@@ -261,8 +266,7 @@ class PromptPilotBackend:
                     "provider": provider,
                     "model": model,
                 }
-                with open(self.preset_file, 'w') as f:
-                    json.dump(presets, f, indent=2)
+                self._write_presets(presets)
                 return True
             return False
         except Exception:
@@ -300,8 +304,7 @@ class PromptPilotBackend:
                 else:
                     return {"status": "fail", "message": f"Preset '{name}' not found"}
 
-            with open(self.preset_file, 'w') as f:
-                json.dump(presets, f, indent=2)
+            self._write_presets(presets)
 
             return {"status": "success", "message": f"Preset {action} successful"}
 
@@ -331,6 +334,7 @@ class PromptPilotBackend:
 
             with open(self.credentials_file, 'w') as f:
                 json.dump(credentials, f, indent=2)
+            self.credentials_version += 1
 
             return {"status": "success", "message": f"Credential {action} successful"}
 
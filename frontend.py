@@ -1,32 +1,63 @@
+import importlib.util
+import logging
 import os
 import sys
-import pyperclip
 import threading
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from string import Template
 from typing import Optional
 
 from backend import APIBackend, resource_path, get_platform
 
 PLATFORM = get_platform()
 
-if PLATFORM == "windows":
-    try:
-        from pynput import keyboard as _pynput_keyboard
-        PYNPUT_AVAILABLE = True
-    except Exception:
-        _pynput_keyboard = None
-        PYNPUT_AVAILABLE = False
-else:
-    _pynput_keyboard = None
-    PYNPUT_AVAILABLE = False
-
-from PySide6.QtCore import Qt, QTimer, QEvent
-from PySide6.QtGui import QFont, QAction, QKeySequence, QPalette, QColor, QIcon
+log = logging.getLogger("promptpilot.frontend")
+
+
+def configure_logging(level_name) -> None:
+    """Set the PromptPilot log level once (e.g. from the 'log_level' setting)."""
+    level = logging.getLevelName(str(level_name or "WARNING").upper())
+    if not isinstance(level, int):
+        level = logging.WARNING
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("promptpilot").setLevel(level)
+
+
+# pynput wird erst beim Start des globalen Listeners importiert (lädt sonst
+# beim App-Start unnötig die Plattform-Hooks).
+_pynput_keyboard = None
+PYNPUT_AVAILABLE = PLATFORM == "windows" and importlib.util.find_spec("pynput") is not None
+
+
+def _load_pynput_keyboard():
+    """Import pynput's keyboard module on first use; returns None if unavailable."""
+    global _pynput_keyboard, PYNPUT_AVAILABLE
+    if _pynput_keyboard is None and PYNPUT_AVAILABLE:
+        try:
+            from pynput import keyboard
+        except Exception as exc:
+            log.debug("pynput konnte nicht geladen werden: %s", exc)
+            PYNPUT_AVAILABLE = False
+        else:
+            _pynput_keyboard = keyboard
+    return _pynput_keyboard
+
+from PySide6.QtCore import (
+    Qt, QTimer, QEvent, QObject, QRunnable, QThreadPool, Signal,
+    QAbstractListModel, QModelIndex, QRect, QRectF, QSize
+)
+from PySide6.QtGui import (
+    QFont, QFontDatabase, QFontMetrics, QAction, QKeySequence, QPalette, QColor, QIcon, QPainter, QPen, QTextLayout,
+    QGuiApplication,
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QLineEdit,
     QVBoxLayout, QHBoxLayout, QPushButton, QComboBox,
     QFrame, QScrollArea, QMessageBox, QStackedWidget,
     QTextEdit, QDialog, QSplitter, QKeySequenceEdit,
-    QSystemTrayIcon, QMenu, QStyle, QSizePolicy
+    QSystemTrayIcon, QMenu, QStyle, QSizePolicy,
+    QListView, QAbstractItemView, QStyledItemDelegate, QToolTip
 )
 
 
@@ -44,10 +75,16 @@ def _is_process_trusted() -> bool:
 # New UI / behavior constants
 MAX_PRESET_NAME_LENGTH = 30  # displayed length before truncation
 MAX_PRESET_NAME_STORE = 60   # max length allowed for storing names
+PROMPT_PREVIEW_LENGTH = 120  # prompt characters shown on a preset card
+SEARCH_DEBOUNCE_MS = 150     # delay before typed search text is applied
+MIN_PRESET_NAME_LENGTH = 3   # form validation: shortest accepted preset name
+MIN_PROMPT_LENGTH = 10       # form validation: shortest accepted prompt
+LISTENER_REBUILD_DELAY_MS = 50  # coalesce hotkey changes before restarting pynput
 
 
 MODIFIER_ORDER = ("Ctrl", "Meta", "Alt", "AltGr", "Shift")
-PRIMARY_MODIFIERS = {"Ctrl", "Alt", "AltGr", "Meta"}
+MODIFIER_RANK = {mod: rank for rank, mod in enumerate(MODIFIER_ORDER)}
+PRIMARY_MODIFIERS = frozenset({"Ctrl", "Alt", "AltGr", "Meta"})
 MODIFIER_SYNONYMS = {
     "ctrl": "Ctrl",
     "control": "Ctrl",
@@ -79,6 +116,29 @@ KEY_SYNONYMS = {
     "comma": ",",
 }
 
+MODIFIER_DISPLAY = {"Ctrl": "Ctrl", "Alt": "Alt", "Shift": "Shift", "AltGr": "AltGr", "Meta": "Meta"}
+MODIFIER_DISPLAY_MAC = {"Ctrl": "Ctrl", "Alt": "⌥", "Shift": "⇧", "AltGr": "AltGr", "Meta": "⌘"}
+
+# Abbildung auf die Schreibweise von pynput.GlobalHotKeys
+# Bereits in pynput-Schreibweise (<mod>), damit pro Aufruf keine Formatierung nötig ist
+PYNPUT_MODIFIERS = {
+    "Ctrl": "<ctrl>", "Control": "<ctrl>", "Shift": "<shift>", "Alt": "<alt>", "Option": "<alt>",
+    "Meta": "<cmd>", "Cmd": "<cmd>", "AltGr": "<alt_gr>",
+}
+PYNPUT_NAMED_KEYS = {
+    "Enter": "enter", "Return": "enter", "Space": "space", "Tab": "tab",
+    "Backspace": "backspace", "Delete": "delete", "Escape": "esc", "Esc": "esc",
+}
+
+# Modifier, die bei Tastendrücken im eventFilter verglichen werden (Keypad etc. ignorieren)
+SHORTCUT_MODIFIER_MASK = (
+    Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier
+    | Qt.KeyboardModifier.AltModifier | Qt.KeyboardModifier.MetaModifier
+).value
+# Return und Enter gelten beim Shortcut-Vergleich als dieselbe Taste
+KEY_ALIASES = {Qt.Key.Key_Return.value: Qt.Key.Key_Enter.value}
+_KEY_PRESS_EVENT = QEvent.Type.KeyPress
+
 
 def _lookup(mapping, key):
     if key in mapping:
@@ -112,45 +172,44 @@ def canonicalize_shortcut(shortcut_str: str, platform: str = None) -> str:
         raise ValueError("Shortcut benötigt mindestens einen Modifier (z.B. Ctrl+T)")
 
     mods_part, key_part = seq_str.rsplit("+", 1)
-    modifiers_raw = [m.strip() for m in mods_part.split("+") if m.strip()]
     key_raw = key_part.strip()
 
-    if not modifiers_raw:
-        raise ValueError("Shortcut benötigt mindestens einen Modifier (z.B. Ctrl+T)")
-    if not key_raw:
-        raise ValueError("Shortcut-Taste konnte nicht erkannt werden")
-
+    # Ein Durchlauf: trimmen, Synonyme auflösen und Duplikate entfernen
     modifiers = []
-    seen_mods = set()
-    for mod in modifiers_raw:
+    for mod in mods_part.split("+"):
+        mod = mod.strip()
+        if not mod:
+            continue
         canonical = _lookup(MODIFIER_SYNONYMS, mod)
         if not canonical:
             raise ValueError(f"Ungültiger Modifier: '{mod}'")
-        if canonical not in seen_mods:
-            seen_mods.add(canonical)
+        if canonical not in modifiers:
             modifiers.append(canonical)
 
+    if not modifiers:
+        raise ValueError("Shortcut benötigt mindestens einen Modifier (z.B. Ctrl+T)")
+    if not key_raw:
+        raise ValueError("Shortcut-Taste konnte nicht erkannt werden")
+
     if not any(m in PRIMARY_MODIFIERS for m in modifiers):
         raise ValueError(
             "Shortcut benötigt mindestens einen Haupt-Modifier (Ctrl/Cmd oder Alt)."
         )
 
     # Sortiere Modifier für eine stabile Darstellung
-    modifiers.sort(key=lambda m: MODIFIER_ORDER.index(m) if m in MODIFIER_ORDER else len(MODIFIER_ORDER))
+    modifiers.sort(key=lambda m: MODIFIER_RANK.get(m, len(MODIFIER_ORDER)))
 
     key_lookup = _lookup(KEY_SYNONYMS, key_raw) or key_raw
     if len(key_lookup) == 1:
         key_lookup = key_lookup.upper()
 
-    canonical = "+".join(modifiers + [key_lookup])
-
-    # Plattform-spezifische Feinheiten (z.B. Cmd auf macOS als Meta belassen)
-    if platform == "darwin":
-        canonical = canonical.replace("Cmd+", "Meta+")
-
-    return canonical
+    # Cmd/Command werden bereits über MODIFIER_SYNONYMS zu Meta, daher ist
+    # kein nachträgliches Ersetzen im fertigen String nötig
+    modifiers.append(key_lookup)
+    return "+".join(modifiers)
 
 
+@lru_cache(maxsize=256)
 def format_shortcut_for_display(shortcut_str: str, platform: str = None) -> str:
     """Returns a user-facing representation of the shortcut (with platform glyphs where appropriate)."""
     if not shortcut_str:
@@ -169,18 +228,12 @@ def format_shortcut_for_display(shortcut_str: str, platform: str = None) -> str:
     if len(key_display) == 1:
         key_display = key_display.upper()
 
-    display_map = {
-        "Ctrl": "Ctrl",
-        "Alt": "Alt" if platform != "darwin" else "⌥",
-        "Shift": "Shift" if platform != "darwin" else "⇧",
-        "AltGr": "AltGr",
-        "Meta": "⌘" if platform == "darwin" else "Meta",
-    }
-
+    display_map = MODIFIER_DISPLAY_MAC if platform == "darwin" else MODIFIER_DISPLAY
     display_mods = [display_map.get(mod, mod) for mod in modifiers]
     return " + ".join(display_mods + [key_display])
 
 
+@lru_cache(maxsize=256)
 def is_valid_shortcut(shortcut_str: str, platform: str = None) -> tuple:
     """
     Validiert einen Shortcut-String.
@@ -193,17 +246,7 @@ def is_valid_shortcut(shortcut_str: str, platform: str = None) -> tuple:
         return False, str(exc)
 
 
-def normalize_shortcut_for_platform(shortcut_str: str, platform: str = None) -> str:
-    """
-    Normalisiert einen Shortcut-String (benutzerfreundliche Synonyme) für Speicherung.
-    Ersetzt z.B. 'Control' -> 'Ctrl', 'Option' -> 'Alt' usw.
-    """
-    try:
-        return canonicalize_shortcut(shortcut_str, platform)
-    except ValueError:
-        return shortcut_str.strip()
-
-
+@lru_cache(maxsize=256)
 def canonicalize_shortcut_for_qt(shortcut_str: str, platform: str = None) -> str:
     """
     Erzeugt eine Qt-kompatible Shortcut-Notation aus einer vom Nutzer eingegebenen Shortcut-Notation.
@@ -217,6 +260,42 @@ def canonicalize_shortcut_for_qt(shortcut_str: str, platform: str = None) -> str
         return shortcut_str.strip()
 
 
+@dataclass(frozen=True, slots=True)
+class ShortcutSpec:
+    """Parsed shortcut shared by the QAction, pynput and eventFilter paths."""
+
+    canonical: str
+    qt: str
+    mods: int  # Modifier-Maske wie im eventFilter (SHORTCUT_MODIFIER_MASK)
+    key: int   # Qt-Tastencode, 0 wenn Qt die Sequenz nicht auflösen kann
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def from_raw(cls, raw: str) -> "ShortcutSpec":
+        """Parse a raw shortcut once; raises ValueError if it is invalid."""
+        canonical = canonicalize_shortcut(raw)
+        qt = canonicalize_shortcut_for_qt(canonical)
+        sequence = QKeySequence(qt)
+        if sequence.isEmpty():
+            return cls(canonical, qt, 0, 0)
+        combo = sequence[0]
+        return cls(
+            canonical,
+            qt,
+            combo.keyboardModifiers().value & SHORTCUT_MODIFIER_MASK,
+            combo.key().value,
+        )
+
+
+def normalize_shortcut_for_platform(shortcut_str: str, platform: str = None) -> str:
+    """
+    Normalisiert einen Shortcut-String (benutzerfreundliche Synonyme) für Speicherung.
+    Ersetzt z.B. 'Control' -> 'Ctrl', 'Option' -> 'Alt' usw.
+    """
+    # Gleiche Normalisierung wie für Qt; teilt sich deren Cache
+    return canonicalize_shortcut_for_qt(shortcut_str, platform)
+
+
 # Platform-specific modifier key (Anzeige / Tooltip)
 def get_modifier_key():
     """Returns 'Meta' for macOS, 'Ctrl' for Windows/Linux"""
@@ -224,6 +303,7 @@ def get_modifier_key():
 
 MODIFIER_KEY = get_modifier_key()
 MODIFIER_KEY_DISPLAY = "⌘" if sys.platform == "darwin" else "Ctrl"
+NAV_TOOLTIP_TEMPLATE = f"Wechsle zu {{}} ({MODIFIER_KEY_DISPLAY}+{{}})"
 
 # Use a guaranteed available font family to avoid expensive lookups for missing
 # fonts such as "SF Pro Display".
@@ -249,6 +329,7 @@ def refresh_app_font_family() -> None:
         app_font = QApplication.font()
         if app_font and app_font.family():
             APP_FONT_FAMILY = app_font.family()
+            init_shared_fonts()
             return
     except Exception:
         # QApplication.font() may raise if no application instance exists yet.
@@ -261,6 +342,273 @@ def refresh_app_font_family() -> None:
     except Exception:
         # If we cannot query Qt for a font we simply keep the fallback.
         pass
+    init_shared_fonts()
+
+
+# Shared QFont instances (implicitly shared by Qt, safe to reuse across widgets).
+# They are built once the QApplication exists, see init_shared_fonts().
+_FONT_TITLE = None
+_FONT_NAV_LABEL = None
+_FONT_SIDEBAR_INFO = None
+_FONT_SIDEBAR_AUTHORS = None
+_FONT_PAGE_TITLE = None
+_FONT_DIALOG_TITLE = None
+_FONT_HEADING = None
+_FONT_CARD_TITLE = None
+_FONT_SECTION_TITLE = None
+_FONT_SUBTITLE = None
+_FONT_SHORTCUT_KEY = None
+
+
+def init_shared_fonts() -> None:
+    """Create the shared fonts for the current APP_FONT_FAMILY."""
+
+    global _FONT_TITLE, _FONT_NAV_LABEL, _FONT_SIDEBAR_INFO, _FONT_SIDEBAR_AUTHORS
+    global _FONT_PAGE_TITLE, _FONT_DIALOG_TITLE, _FONT_HEADING, _FONT_CARD_TITLE
+    global _FONT_SECTION_TITLE, _FONT_SUBTITLE, _FONT_SHORTCUT_KEY
+
+    _FONT_TITLE = QFont(APP_FONT_FAMILY, 22, QFont.Weight.Bold)
+    _FONT_NAV_LABEL = QFont(APP_FONT_FAMILY, 11, QFont.Weight.Bold)
+    _FONT_SIDEBAR_INFO = QFont(APP_FONT_FAMILY, 10)
+    _FONT_SIDEBAR_AUTHORS = QFont(APP_FONT_FAMILY, 9)
+    _FONT_PAGE_TITLE = QFont(APP_FONT_FAMILY, 28, QFont.Weight.Bold)
+    _FONT_DIALOG_TITLE = QFont(APP_FONT_FAMILY, 20, QFont.Weight.Bold)
+    _FONT_HEADING = QFont(APP_FONT_FAMILY, 18, QFont.Weight.Bold)
+    _FONT_CARD_TITLE = QFont(APP_FONT_FAMILY, 16, QFont.Weight.Bold)
+    _FONT_SECTION_TITLE = QFont(APP_FONT_FAMILY, 14, QFont.Weight.Bold)
+    _FONT_SUBTITLE = QFont(APP_FONT_FAMILY, 14)
+    # Einmal auflösen statt Qt bei jedem Label nach einem Ersatz für "SF Mono" suchen zu lassen
+    if QFontDatabase.hasFamily("SF Mono"):
+        _FONT_SHORTCUT_KEY = QFont("SF Mono", 11, QFont.Weight.Medium)
+    else:
+        _FONT_SHORTCUT_KEY = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        _FONT_SHORTCUT_KEY.setPointSize(11)
+        _FONT_SHORTCUT_KEY.setWeight(QFont.Weight.Medium)
+
+
+# Palettenfarben je Theme. Die QColor-Objekte werden nur einmal erzeugt und die
+# fertigen Paletten beim ersten Gebrauch in _PALETTES zwischengespeichert.
+_THEME_PALETTE_COLORS = {
+    "dark": (
+        (QPalette.ColorRole.Window, QColor(28, 28, 30)),
+        (QPalette.ColorRole.WindowText, QColor(240, 240, 240)),
+        (QPalette.ColorRole.Base, QColor(44, 44, 46)),
+        (QPalette.ColorRole.AlternateBase, QColor(58, 58, 60)),
+        (QPalette.ColorRole.ToolTipBase, QColor(240, 240, 240)),
+        (QPalette.ColorRole.ToolTipText, QColor(12, 12, 12)),
+        (QPalette.ColorRole.Text, QColor(245, 245, 247)),
+        (QPalette.ColorRole.Button, QColor(44, 44, 46)),
+        (QPalette.ColorRole.ButtonText, QColor(245, 245, 247)),
+        (QPalette.ColorRole.BrightText, QColor(255, 255, 255)),
+        (QPalette.ColorRole.Link, QColor(0, 122, 255)),
+        (QPalette.ColorRole.Highlight, QColor(0, 122, 255)),
+        (QPalette.ColorRole.HighlightedText, QColor(255, 255, 255)),
+    ),
+    "light": (
+        (QPalette.ColorRole.Window, QColor(245, 246, 248)),
+        (QPalette.ColorRole.WindowText, QColor(28, 28, 30)),
+        (QPalette.ColorRole.Base, QColor(255, 255, 255)),
+        (QPalette.ColorRole.AlternateBase, QColor(242, 242, 247)),
+        (QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255)),
+        (QPalette.ColorRole.ToolTipText, QColor(28, 28, 30)),
+        (QPalette.ColorRole.Text, QColor(28, 28, 30)),
+        (QPalette.ColorRole.Button, QColor(255, 255, 255)),
+        (QPalette.ColorRole.ButtonText, QColor(28, 28, 30)),
+        (QPalette.ColorRole.BrightText, QColor(0, 0, 0)),
+        (QPalette.ColorRole.Link, QColor(0, 122, 255)),
+        (QPalette.ColorRole.Highlight, QColor(0, 122, 255)),
+        (QPalette.ColorRole.HighlightedText, QColor(255, 255, 255)),
+    ),
+}
+_PALETTES = {}
+# Fertig eingesetzte Stylesheets je (Theme, Schriftfamilie)
+_STYLESHEETS = {}
+
+# Stylesheet-Vorlagen je Theme. Sie werden einmal beim Import erstellt; beim
+# Anwenden werden nur noch Schrift und Akzentfarben eingesetzt.
+_DARK_STYLE_TEMPLATE = Template("""
+QWidget { background-color: #1c1c1e; color: #f5f5f7; font-family: $font_stack; }
+#top_nav { background-color: rgba(28,28,30,0.92); border-bottom: 1px solid rgba(255,255,255,0.08); border-radius: 18px; }
+#top_nav QLabel#app_title { color: #f5f5f7; letter-spacing: 0.2px; }
+#top_nav_separator { background-color: rgba(255,255,255,0.12); width: 1px; }
+#sidebar { background-color: #2c2c2e; border: 1px solid rgba(255,255,255,0.05); border-radius: 20px; }
+#sidebar_info, #sidebar_authors { color: rgba(255,255,255,0.55); }
+#sidebar_bottom { background-color: transparent; border-top: 1px solid rgba(255,255,255,0.06); border-radius: 14px; }
+QPushButton#nav_button { background: transparent; border: none; color: rgba(255,255,255,0.72); text-align: left; padding: 10px 16px; border-radius: 12px; }
+QPushButton#nav_button[active="true"] { background-color: rgba(255,255,255,0.12); color: #ffffff; font-weight: 600; }
+QPushButton#nav_button:hover { background-color: rgba(255,255,255,0.08); }
+.content_card, .preset_card, .shortcut_card, #result_panel { background-color: rgba(44,44,46,0.9); border-radius: 18px; border: 1px solid rgba(255,255,255,0.08); }
+#page_stack { background: transparent; }
+
+/* Blaue Button-Stile */
+QPushButton#btn_primary,
+QPushButton#btn_secondary,
+QPushButton#btn_success,
+QPushButton#btn_danger,
+QPushButton#btn_warning {
+    background-color: #007aff; /* Blau */
+    color: #ffffff;
+}
+QPushButton#btn_primary:hover,
+QPushButton#btn_secondary:hover,
+QPushButton#btn_success:hover,
+QPushButton#btn_danger:hover,
+QPushButton#btn_warning:hover {
+    background-color: #0a84ff; /* Dunkleres Blau beim Hover */
+}
+
+QPushButton#btn_ghost { background-color: transparent; color: #007aff; padding: 6px 12px; border-radius: 10px; }
+QPushButton#btn_ghost:hover { background-color: rgba(255,255,255,0.08); }
+QLineEdit, QTextEdit, QComboBox, QKeySequenceEdit { background: rgba(58,58,60,0.95); border: 1px solid rgba(255,255,255,0.12); color: #f5f5f7; border-radius: 12px; selection-background-color: #007aff; selection-color: #ffffff; }
+QLineEdit[error="true"], QTextEdit[error="true"], QKeySequenceEdit[error="true"] { border: 1px solid #ff453a; } /* Danger-Farbe beibehalten, da es keine Schaltfläche ist */
+QLabel#section_title { color: #ffffff; }
+QLabel#section_subtitle { color: rgba(255,255,255,0.65); }
+QLabel#section_subtitle[status="ok"] { color: #3fb950; font-weight: 600; }
+QLabel#section_subtitle[status="pending"] { color: #58a6ff; font-weight: 600; }
+QLabel#section_subtitle[status="error"] { color: #f85149; font-weight: 600; }
+QLabel#input_label { color: rgba(255,255,255,0.82); font-weight: 600; letter-spacing: 0.2px; }
+QLabel#hint_text { color: rgba(255,255,255,0.55); font-size: 13px; }
+QLabel#error_label { color: #ff453a; font-size: 13px; } /* Danger-Farbe beibehalten */
+QLabel#preset_header { color: #ffffff; font-size: 17px; font-weight: 700; }
+QLabel#preset_meta, QLabel#presets_counter { color: rgba(255,255,255,0.65); font-size: 13px; }
+QLabel#preset_prompt { color: rgba(255,255,255,0.86); font-size: 13px; }
+QLabel#shortcut_badge { background-color: rgba(255,255,255,0.12); color: #ffffff; border-radius: 999px; padding: 4px 12px; font-weight: 600; }
+
+/* Shortcut Chip auf Blau geändert */
+QPushButton#shortcut_chip { background-color: rgba(0,122,255,0.3); color: #e4f0ff; border: 1px solid rgba(0,122,255,0.55); border-radius: 10px; padding: 6px 12px; font-weight: 700; font-family: 'JetBrains Mono', 'SF Mono', monospace; }
+QPushButton#shortcut_chip:hover { background-color: rgba(0,122,255,0.45); color: #ffffff; }
+QPushButton#shortcut_chip[empty="true"] { border: 1px dashed rgba(255,255,255,0.38); background: transparent; color: rgba(228,240,255,0.9); }
+
+QLabel#toast { background: rgba(0,0,0,0.8); color: #ffffff; padding: 12px 20px; border-radius: 14px; font-weight: 600; }
+QLabel#shortcut_key { color: #f5f5f7; font-family: 'JetBrains Mono', 'SF Mono', monospace; font-weight: 600; }
+QLabel#shortcut_desc { color: rgba(255,255,255,0.65); }
+QWidget#shortcut_item { background-color: rgba(58,58,60,0.9); border-radius: 14px; border: 1px solid rgba(255,255,255,0.04); }
+QWidget#empty_state { background: transparent; color: rgba(255,255,255,0.6); }
+QLabel#empty_title { color: #6c757d; }
+QListView#preset_list { border: none; background: transparent; }
+QSplitter::handle:horizontal { width: 2px; background: rgba(255,255,255,0.08); }
+QKeySequenceEdit#shortcut_input { color: #f5f5f7; }
+QFrame#section_divider { background-color: rgba(255,255,255,0.12); max-height: 1px; min-height: 1px; }
+""")
+
+_LIGHT_STYLE_TEMPLATE = Template("""
+QWidget { background-color: #f5f5f7; color: #1c1c1e; font-family: $font_stack; }
+#top_nav { background-color: rgba(255,255,255,0.9); border-bottom: 1px solid rgba(60,60,67,0.12); border-radius: 18px; }
+#top_nav QLabel#app_title { color: #1c1c1e; letter-spacing: 0.2px; }
+#top_nav_separator { background-color: rgba(60,60,67,0.18); width: 1px; }
+#sidebar { background-color: #ffffff; border: 1px solid rgba(60,60,67,0.12); border-radius: 20px; }
+#sidebar_info, #sidebar_authors { color: rgba(60,60,67,0.6); }
+#sidebar_bottom { background-color: rgba(250,250,252,0.8); border-top: 1px solid rgba(60,60,67,0.08); border-radius: 14px; }
+QPushButton#nav_button { background: transparent; border: none; color: rgba(28,28,30,0.8); text-align: left; padding: 10px 16px; border-radius: 12px; }
+QPushButton#nav_button[active="true"] { background-color: rgba(0,122,255,0.12); color: #0a84ff; font-weight: 600; }
+QPushButton#nav_button:hover { background-color: rgba(0,0,0,0.05); }
+.content_card, .preset_card, .shortcut_card, #result_panel { background-color: #ffffff; border-radius: 18px; border: 1px solid rgba(60,60,67,0.12); }
+#page_stack { background: transparent; }
+QPushButton#btn_primary { background-color: $accent; color: #ffffff; }
+QPushButton#btn_primary:hover { background-color: #0a84ff; }
+QPushButton#btn_secondary { background-color: rgba(60,60,67,0.08); color: #1c1c1e; }
+QPushButton#btn_secondary:hover { background-color: rgba(60,60,67,0.14); }
+QPushButton#btn_success { background-color: $success; color: #ffffff; }
+QPushButton#btn_danger { background-color: $danger; color: #ffffff; }
+QPushButton#btn_warning { background-color: rgba(255,149,0,0.28); color: #c93400; }
+QPushButton#btn_ghost { background-color: transparent; color: $accent; padding: 6px 12px; border-radius: 10px; }
+QPushButton#btn_ghost:hover { background-color: rgba(0,122,255,0.08); }
+QLineEdit, QTextEdit, QComboBox, QKeySequenceEdit { background: #ffffff; border: 1px solid rgba(60,60,67,0.18); color: #1c1c1e; border-radius: 12px; selection-background-color: $accent; selection-color: #ffffff; }
+QLineEdit[error="true"], QTextEdit[error="true"], QKeySequenceEdit[error="true"] { border: 1px solid $danger; }
+QLabel#section_title { color: #111; }
+QLabel#section_subtitle { color: rgba(60,60,67,0.75); }
+QLabel#section_subtitle[status="ok"] { color: #3fb950; font-weight: 600; }
+QLabel#section_subtitle[status="pending"] { color: #58a6ff; font-weight: 600; }
+QLabel#section_subtitle[status="error"] { color: #f85149; font-weight: 600; }
+QLabel#input_label { color: rgba(28,28,30,0.9); font-weight: 600; letter-spacing: 0.2px; }
+QLabel#hint_text { color: rgba(60,60,67,0.6); font-size: 13px; }
+QLabel#error_label { color: $danger; font-size: 13px; }
+QLabel#preset_header { color: #111; font-size: 17px; font-weight: 700; }
+QLabel#preset_meta, QLabel#presets_counter { color: rgba(60,60,67,0.65); font-size: 13px; }
+QLabel#preset_prompt { color: rgba(28,28,30,0.82); font-size: 13px; }
+QLabel#shortcut_badge { background-color: rgba(0,122,255,0.12); color: #0a84ff; border-radius: 999px; padding: 4px 12px; font-weight: 600; }
+QPushButton#shortcut_chip { background-color: rgba(10,132,255,0.12); color: #0a84ff; border: 1px solid rgba(0,122,255,0.35); border-radius: 10px; padding: 6px 12px; font-weight: 700; font-family: 'JetBrains Mono', 'SF Mono', monospace; }
+QPushButton#shortcut_chip:hover { background-color: rgba(10,132,255,0.2); color: #0060df; }
+QPushButton#shortcut_chip[empty="true"] { border: 1px dashed rgba(0,122,255,0.35); background: transparent; color: rgba(10,132,255,0.85); }
+QLabel#toast { background: rgba(28,28,30,0.85); color: #ffffff; padding: 12px 20px; border-radius: 14px; font-weight: 600; }
+QLabel#shortcut_key { color: #111; font-family: 'JetBrains Mono', 'SF Mono', monospace; font-weight: 600; }
+QLabel#shortcut_desc { color: rgba(28,28,30,0.6); }
+QWidget#shortcut_item { background-color: rgba(0,0,0,0.03); border-radius: 14px; border: 1px solid rgba(60,60,67,0.08); }
+QWidget#empty_state { background: transparent; color: rgba(60,60,67,0.55); }
+QLabel#empty_title { color: #6c757d; }
+QListView#preset_list { border: none; background: transparent; }
+QSplitter::handle:horizontal { width: 2px; background: rgba(60,60,67,0.12); }
+QKeySequenceEdit#shortcut_input { color: #1c1c1e; }
+QFrame#section_divider { background-color: rgba(60,60,67,0.15); max-height: 1px; min-height: 1px; }
+""")
+
+_COMMON_STYLE_TEMPLATE = Template("""
+* { font-family: $font_stack; font-size: 13px; }
+QPushButton { border: none; border-radius: 12px; font-weight: 600; padding: 10px 18px; }
+QLineEdit, QComboBox, QTextEdit, QKeySequenceEdit { padding: 10px 14px; font-size: 13px; }
+QTextEdit { padding: 12px 14px; }
+""")
+
+_STYLE_COLORS = {"accent": "#007aff", "success": "#34c759", "danger": "#ff3b30"}
+
+
+def build_stylesheet(theme: str) -> str:
+    """Return the full application stylesheet for the given theme (cached per font family)."""
+
+    key = ("dark" if theme == "dark" else "light", APP_FONT_FAMILY)
+    stylesheet = _STYLESHEETS.get(key)
+    if stylesheet is None:
+        font_stack = (
+            f"'{APP_FONT_FAMILY}', 'SF Pro Text', 'SF Pro Display', '-apple-system', "
+            "'Helvetica Neue', 'Segoe UI', sans-serif"
+        )
+        template = _DARK_STYLE_TEMPLATE if key[0] == "dark" else _LIGHT_STYLE_TEMPLATE
+        stylesheet = (template.substitute(_STYLE_COLORS, font_stack=font_stack)
+                      + _COMMON_STYLE_TEMPLATE.substitute(font_stack=font_stack))
+        _STYLESHEETS[key] = stylesheet
+    return stylesheet
+
+
+def _palette_for(theme: str) -> QPalette:
+    """Return the cached QPalette for a theme, building it on first use."""
+
+    key = "dark" if theme == "dark" else "light"
+    palette = _PALETTES.get(key)
+    if palette is None:
+        palette = QPalette()
+        for role, color in _THEME_PALETTE_COLORS[key]:
+            palette.setColor(role, color)
+        _PALETTES[key] = palette
+    return palette
+
+
+def read_clipboard() -> str:
+    """Read clipboard text in-process via Qt; pyperclip only without a QApplication."""
+    if QGuiApplication.instance() is not None:
+        return QGuiApplication.clipboard().text()
+    import pyperclip  # lazy import: only needed without a QApplication
+    return pyperclip.paste()
+
+
+def write_clipboard(text: str) -> None:
+    """Write clipboard text in-process via Qt; pyperclip only without a QApplication."""
+    if QGuiApplication.instance() is not None:
+        QGuiApplication.clipboard().setText(text)
+    else:
+        import pyperclip  # lazy import: only needed without a QApplication
+        pyperclip.copy(text)
+
+
+def set_style_property(widget: QWidget, name: str, value: object) -> None:
+    """Set a dynamic style property and repolish the widget only if the value changed."""
+
+    current = widget.property(name)
+    if current == value or (current is None and not value):
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
 
 
 def create_section_divider() -> QFrame:
@@ -274,6 +622,45 @@ def create_section_divider() -> QFrame:
     return divider
 
 
+class _WorkerSignals(QObject):
+    finished = Signal(dict)
+
+
+class _PresetWorker(QRunnable):
+    """Führt ein Preset in einem Hintergrund-Thread aus."""
+
+    def __init__(self, backend, preset_name: str, clipboard_text: str):
+        super().__init__()
+        self._backend = backend
+        self._preset_name = preset_name
+        self._clipboard_text = clipboard_text
+        self.signals = _WorkerSignals()
+
+    def run(self) -> None:  # pragma: no cover - executed in separate thread
+        try:
+            result = self._backend.execute_preset(self._preset_name, self._clipboard_text)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            result = {"status": "fail", "message": str(exc)}
+        self.signals.finished.emit(result)
+
+
+class _CredentialTestWorker(QRunnable):
+    """Testet die API-Zugangsdaten eines Providers in einem Hintergrund-Thread."""
+
+    def __init__(self, backend, provider: str):
+        super().__init__()
+        self._backend = backend
+        self._provider = provider
+        self.signals = _WorkerSignals()
+
+    def run(self) -> None:  # pragma: no cover - executed in separate thread
+        try:
+            result = self._backend.test_credential(self._provider)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            result = {"status": "fail", "message": str(exc)}
+        self.signals.finished.emit(result)
+
+
 class EditPresetDialog(QDialog):
     """Dialog zum Bearbeiten eines bestehenden Presets"""
 
@@ -297,8 +684,6 @@ class EditPresetDialog(QDialog):
         self.name_input.setPlaceholderText("z.B. Text Zusammenfassung")
         self.name_input.setMinimumHeight(40)
         self.name_input.setMaxLength(MAX_PRESET_NAME_STORE)
-        if preset_data:
-            self.name_input.setText(preset_data.get("name", ""))
         layout.addWidget(self.name_input)
 
         # Prompt
@@ -310,8 +695,6 @@ class EditPresetDialog(QDialog):
         self.prompt_input.setPlaceholderText("Schreibe deinen Prompt hier...")
         self.prompt_input.setAcceptRichText(False)
         self.prompt_input.setMinimumHeight(180)
-        if preset_data:
-            self.prompt_input.setPlainText(preset_data.get("prompt", ""))
         layout.addWidget(self.prompt_input)
 
         # Provider
@@ -321,7 +704,6 @@ class EditPresetDialog(QDialog):
 
         self.provider_combo = QComboBox()
         self.provider_combo.setMinimumHeight(40)
-        self.provider_combo.addItems(list(self.provider_models.keys()))
         self.provider_combo.currentTextChanged.connect(self._update_models)
         layout.addWidget(self.provider_combo)
 
@@ -334,28 +716,6 @@ class EditPresetDialog(QDialog):
         self.model_combo.setMinimumHeight(40)
         layout.addWidget(self.model_combo)
 
-        provider_value = preset_data.get("provider") if preset_data else None
-        model_value = preset_data.get("model") if preset_data else None
-        fallback_provider = preset_data.get("api_type") if preset_data else None
-        if provider_value and provider_value not in self.provider_models:
-            self.provider_combo.addItem(provider_value)
-        if fallback_provider and fallback_provider not in self.provider_models:
-            self.provider_combo.addItem(fallback_provider)
-
-        if provider_value:
-            idx = self.provider_combo.findText(provider_value)
-            if idx >= 0:
-                self.provider_combo.setCurrentIndex(idx)
-        elif fallback_provider:
-            idx = self.provider_combo.findText(fallback_provider)
-            if idx >= 0:
-                self.provider_combo.setCurrentIndex(idx)
-        self._update_models(self.provider_combo.currentText())
-        if model_value:
-            m_idx = self.model_combo.findText(model_value)
-            if m_idx >= 0:
-                self.model_combo.setCurrentIndex(m_idx)
-
         layout.addSpacing(16)
 
         # Buttons
@@ -378,6 +738,42 @@ class EditPresetDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+        self.load(preset_data)
+
+    def load(self, preset_data=None, provider_models=None):
+        """Füllt den Dialog mit einem Preset, damit er wiederverwendet werden kann."""
+        if provider_models is not None:
+            self.provider_models = provider_models
+        preset_data = preset_data or {}
+        self.name_input.setText(preset_data.get("name", ""))
+        self.prompt_input.setPlainText(preset_data.get("prompt", ""))
+
+        self.provider_combo.blockSignals(True)
+        self.provider_combo.clear()
+        self.provider_combo.addItems(list(self.provider_models.keys()))
+        provider_value = preset_data.get("provider")
+        model_value = preset_data.get("model")
+        fallback_provider = preset_data.get("api_type")
+        if provider_value and provider_value not in self.provider_models:
+            self.provider_combo.addItem(provider_value)
+        if fallback_provider and fallback_provider not in self.provider_models:
+            self.provider_combo.addItem(fallback_provider)
+
+        if provider_value:
+            idx = self.provider_combo.findText(provider_value)
+            if idx >= 0:
+                self.provider_combo.setCurrentIndex(idx)
+        elif fallback_provider:
+            idx = self.provider_combo.findText(fallback_provider)
+            if idx >= 0:
+                self.provider_combo.setCurrentIndex(idx)
+        self.provider_combo.blockSignals(False)
+        self._update_models(self.provider_combo.currentText())
+        if model_value:
+            m_idx = self.model_combo.findText(model_value)
+            if m_idx >= 0:
+                self.model_combo.setCurrentIndex(m_idx)
+
     def get_data(self):
         return {
             "name": self.name_input.text().strip(),
@@ -408,7 +804,7 @@ class ShortcutDialog(QDialog):
 
         info_label = QLabel("Tastenkombination")
         info_label.setObjectName("dialog_title")
-        info_label.setFont(QFont(APP_FONT_FAMILY, 16, QFont.Weight.Bold))
+        info_label.setFont(_FONT_CARD_TITLE)
         layout.addWidget(info_label)
 
         desc = QLabel("Definiere eine Tastenkombination für schnellen Zugriff")
@@ -418,12 +814,6 @@ class ShortcutDialog(QDialog):
         self.shortcut_edit = QKeySequenceEdit()
         self.shortcut_edit.setObjectName("shortcut_input")
         self.shortcut_edit.setMaximumSequenceLength(1)
-        if current_shortcut:
-            try:
-                normalized = canonicalize_shortcut(current_shortcut)
-            except ValueError:
-                normalized = current_shortcut
-            self.shortcut_edit.setKeySequence(QKeySequence(normalized))
         layout.addWidget(self.shortcut_edit)
 
         # Beispiele - plattformspezifisch
@@ -458,6 +848,22 @@ class ShortcutDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+        self.reset(current_shortcut)
+
+    def reset(self, current_shortcut=""):
+        """Setzt Eingabe und Fehlerzustand zurück, damit der Dialog wiederverwendet werden kann."""
+        self._result_shortcut = ""
+        self.error_label.hide()
+        set_style_property(self.shortcut_edit, "error", False)
+        if current_shortcut:
+            try:
+                normalized = canonicalize_shortcut(current_shortcut)
+            except ValueError:
+                normalized = current_shortcut
+            self.shortcut_edit.setKeySequence(QKeySequence(normalized))
+        else:
+            self.shortcut_edit.clear()
+
     def validate_and_accept(self):
         """Validiert den Shortcut vor dem Akzeptieren"""
         sequence = self.shortcut_edit.keySequence()
@@ -474,19 +880,17 @@ class ShortcutDialog(QDialog):
 
         self._result_shortcut = normalized
         self.error_label.hide()
-        self.shortcut_edit.setProperty("error", False)
+        set_style_property(self.shortcut_edit, "error", False)
         self.accept()
 
     def show_error(self, message):
         """Zeigt einen Fehler an"""
         self.error_label.setText(message)
         self.error_label.show()
-        self.shortcut_edit.setProperty("error", True)
-        self.shortcut_edit.style().unpolish(self.shortcut_edit)
-        self.shortcut_edit.style().polish(self.shortcut_edit)
+        set_style_property(self.shortcut_edit, "error", True)
 
     def get_shortcut(self):
-        return getattr(self, "_result_shortcut", "")
+        return self._result_shortcut
 
 
 class ShortcutOverviewDialog(QDialog):
@@ -504,7 +908,7 @@ class ShortcutOverviewDialog(QDialog):
 
         title = QLabel("Registrierte Shortcuts")
         title.setObjectName("dialog_title")
-        title.setFont(QFont(APP_FONT_FAMILY, 20, QFont.Weight.Bold))
+        title.setFont(_FONT_DIALOG_TITLE)
         layout.addWidget(title)
 
         subtitle = QLabel("Alle verfügbaren Tastenkombinationen auf einen Blick")
@@ -531,7 +935,7 @@ class ShortcutOverviewDialog(QDialog):
 
         system_title = QLabel("System-Shortcuts")
         system_title.setObjectName("card_title")
-        system_title.setFont(QFont(APP_FONT_FAMILY, 14, QFont.Weight.Bold))
+        system_title.setFont(_FONT_SECTION_TITLE)
         system_layout.addWidget(system_title)
 
         system_layout.addWidget(self.create_shortcut_item(format_shortcut_for_display(f"{MODIFIER_KEY}+1"), "Presets-Seite"))
@@ -547,14 +951,16 @@ class ShortcutOverviewDialog(QDialog):
 
         preset_title = QLabel("Preset-Shortcuts")
         preset_title.setObjectName("card_title")
-        preset_title.setFont(QFont(APP_FONT_FAMILY, 14, QFont.Weight.Bold))
+        preset_title.setFont(_FONT_SECTION_TITLE)
         preset_layout.addWidget(preset_title)
 
         if shortcuts_dict and presets:
+            preset_count = len(presets)
+            add_item = preset_layout.addWidget
+            create_item = self.create_shortcut_item
             for shortcut, idx in shortcuts_dict.items():
-                if 0 <= idx < len(presets):
-                    preset_name = presets[idx]["name"]
-                    preset_layout.addWidget(self.create_shortcut_item(format_shortcut_for_display(shortcut), preset_name))
+                if 0 <= idx < preset_count:
+                    add_item(create_item(format_shortcut_for_display(shortcut), presets[idx]["name"]))
         else:
             no_shortcuts = QLabel("Keine Preset-Shortcuts definiert")
             no_shortcuts.setObjectName("section_subtitle")
@@ -582,7 +988,7 @@ class ShortcutOverviewDialog(QDialog):
 
         key_label = QLabel(shortcut)
         key_label.setObjectName("shortcut_key")
-        key_label.setFont(QFont("SF Mono", 11, QFont.Weight.Medium))
+        key_label.setFont(_FONT_SHORTCUT_KEY)
         layout.addWidget(key_label)
 
         arrow = QLabel("→")
@@ -597,8 +1003,13 @@ class ShortcutOverviewDialog(QDialog):
 
 
 class APIManager(QMainWindow):
+    # Von pynput-Threads ausgelöst; Qt stellt das Signal per Queued Connection
+    # im Hauptthread zu (Preset-Index, Shortcut oder "")
+    _preset_hotkey_fired = Signal(int, str)
+
     def __init__(self):
         super().__init__()
+        self._preset_hotkey_fired.connect(self._on_preset_hotkey_fired)
         self._platform = PLATFORM
         self.setWindowTitle("PromptPilot")
         # Erlaube eine größere Standardgröße und verhindere unnötiges Scrollen
@@ -607,12 +1018,22 @@ class APIManager(QMainWindow):
 
         # Backend frühzeitig initialisieren, damit Einstellungen gelesen werden können
         self.backend = APIBackend()
+        configure_logging(self.backend.get_setting('log_level', 'WARNING'))
+        # Gelesene Presets/Credentials, gültig solange sich die Backend-Version nicht ändert
+        self._presets_cache = []
+        self._presets_cache_version = -1
+        self._credentials_cache = {}
+        self._credentials_cache_version = -1
 
         self.global_hotkeys_supported = self._platform == "windows" and PYNPUT_AVAILABLE
 
         # Verwaltung von Shortcuts
         self.preset_shortcuts = {}
         self.preset_shortcut_actions = {}
+        self._index_to_shortcut = {}
+        # Cache der Shortcut-Übersicht und der Stand (Presets, Shortcuts), für den sie gebaut wurde
+        self._shortcuts_overview = None
+        self._shortcuts_overview_key = None
         self.visibility_action = None
 
         # Globale Hotkey-Verwaltung (pynput)
@@ -620,10 +1041,22 @@ class APIManager(QMainWindow):
         self._global_hotkey_map = {}
         self._shortcut_to_pynput = {}
         self._visibility_pynput_key = None
+        # Änderungen an der Hotkey-Map werden gesammelt; der Listener startet danach einmal neu
+        self._listener_timer = QTimer(self)
+        self._listener_timer.setSingleShot(True)
+        self._listener_timer.setInterval(LISTENER_REBUILD_DELAY_MS)
+        self._listener_timer.timeout.connect(self._update_pynput_listener)
 
         # Sichtbarkeits-Shortcut Tracking
         self.visibility_shortcut_parsed = None
         self.visibility_shortcut_raw = None
+        # (Modifier-Maske, Qt-Key) -> Callback für Tastendrücke im eventFilter.
+        # Preset-Shortcuts laufen über QActions und sind hier bewusst nicht
+        # eingetragen, damit sie nicht doppelt auslösen.
+        self._shortcut_dispatch = {}
+
+        # Laufende Preset-Ausführungen (Referenz halten, bis das Ergebnis da ist)
+        self._pending_preset_tasks = set()
 
         self._is_quitting = False
         self._close_to_tray_notified = False
@@ -633,10 +1066,14 @@ class APIManager(QMainWindow):
 
         # Theme initialisieren (dark/light) aus Backend-Einstellungen
         self.current_theme = self.backend.get_setting('theme', 'dark')
+        self._applied_theme = None
         self.apply_stylesheets(self.current_theme)
 
         self.current_page_index = 0
 
+        if _FONT_TITLE is None:
+            init_shared_fonts()
+
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
 
@@ -659,10 +1096,10 @@ class APIManager(QMainWindow):
         self.page_stack.setObjectName("page_stack")
 
         self.home_page = HomePage(self)
-        self.credentials_page = CredentialsPage(self)
+        # Die API-Einstellungen werden erst beim ersten Öffnen aufgebaut
+        self.credentials_page = None
 
         self.page_stack.addWidget(self.home_page)
-        self.page_stack.addWidget(self.credentials_page)
         self.page_stack.setCurrentIndex(0)
 
         content_layout.addWidget(self.page_stack, 1)
@@ -673,23 +1110,18 @@ class APIManager(QMainWindow):
         self.toast_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.toast_label.setObjectName("toast")
         self.toast_label.hide()
+        self._toast_key = None
         self.toast_timer = QTimer(self)
+        self.toast_timer.setSingleShot(True)
         self.toast_timer.timeout.connect(self.hide_toast)
 
-        # For improved visibility-shortcut handling install an application-level event filter
-        # and keep a parsed representation of the visibility shortcut for consistent behaviour
-        # across platforms.
-        app = QApplication.instance()
-        if app:
-            app.installEventFilter(self)
+        # Der App-weite eventFilter wird nur installiert, solange der Sichtbarkeits-Shortcut
+        # ihn braucht (siehe register_visibility_shortcut); sonst läuft jedes Event durch Python.
+        self._event_filter_installed = False
 
-        # Lade und registriere gespeicherte Preset-Shortcuts
+        # Lade und registriere gespeicherte Preset-Shortcuts (startet auch den globalen Listener)
         self.load_saved_shortcuts()
 
-        if self.global_hotkeys_supported and self._global_hotkey_map:
-            # Start listener if es bereits registrierte Shortcuts gibt
-            self._update_pynput_listener()
-
         self._tray_boot_message_shown = False
         if self._platform != "mac":
             self._setup_tray_icon()
@@ -754,39 +1186,59 @@ class APIManager(QMainWindow):
             )
             self._tray_boot_message_shown = True
 
+    def _menu_separator(self):
+        # Eigentümer ist das Menü, damit tray_menu.clear() den Trenner wieder löscht
+        separator = QAction(self.tray_menu)
+        separator.setSeparator(True)
+        return separator
+
+    def _on_tray_preset_action(self):
+        # Gemeinsamer Slot aller Tray-Preset-Einträge; der Index steckt in QAction.data()
+        action = self.sender()
+        if isinstance(action, QAction):
+            self.execute_preset_by_index(action.data(), source="tray")
+
     def refresh_tray_menu(self):
+        # Wird nach jedem Speichern/Bearbeiten/Löschen eines Presets aufgerufen
         if self.tray_menu:
             self.tray_menu.clear()
-            presets = list(self.backend.presets)
+            presets = self.presets
+            # Alle Einträge gehören dem Menü, damit clear() sie beim nächsten Aufbau freigibt
+            menu = self.tray_menu
+            actions = []
             if presets:
                 for idx, preset in enumerate(presets):
-                    action = QAction(preset["name"], self)
-                    action.triggered.connect(lambda _checked=False, i=idx: self.execute_preset_by_index(i, source="tray"))
-                    self.tray_menu.addAction(action)
+                    action = QAction(preset["name"], menu)
+                    action.setData(idx)
+                    action.triggered.connect(self._on_tray_preset_action)
+                    actions.append(action)
             else:
-                placeholder = QAction("Keine Presets verfügbar", self)
+                placeholder = QAction("Keine Presets verfügbar", menu)
                 placeholder.setEnabled(False)
-                self.tray_menu.addAction(placeholder)
+                actions.append(placeholder)
 
-            self.tray_menu.addSeparator()
+            actions.append(self._menu_separator())
 
-            show_action = QAction("PromptPilot anzeigen", self)
+            show_action = QAction("PromptPilot anzeigen", menu)
             show_action.triggered.connect(self.show_window)
-            self.tray_menu.addAction(show_action)
+            actions.append(show_action)
 
-            presets_action = QAction("Preset Manager öffnen", self)
+            presets_action = QAction("Preset Manager öffnen", menu)
             presets_action.triggered.connect(self.open_preset_manager)
-            self.tray_menu.addAction(presets_action)
+            actions.append(presets_action)
 
-            api_action = QAction("API Einstellungen öffnen", self)
+            api_action = QAction("API Einstellungen öffnen", menu)
             api_action.triggered.connect(self.open_api_settings)
-            self.tray_menu.addAction(api_action)
+            actions.append(api_action)
 
-            self.tray_menu.addSeparator()
+            actions.append(self._menu_separator())
 
-            quit_action = QAction("Beenden", self)
+            quit_action = QAction("Beenden", menu)
             quit_action.triggered.connect(self._quit_from_tray)
-            self.tray_menu.addAction(quit_action)
+            actions.append(quit_action)
+
+            # Menü in einem Aufruf befüllen statt pro Eintrag
+            self.tray_menu.addActions(actions)
 
         if self.statusbar_app:
             self.statusbar_app.update_presets()
@@ -830,27 +1282,22 @@ class APIManager(QMainWindow):
 
     def trigger_preset_by_index(self, index, shortcut_key: Optional[str] = None):
         """Safely trigger preset execution on the Qt main thread from background threads."""
-
-        def _run(idx=index, key=shortcut_key):
-            if key:
-                self.on_preset_shortcut_triggered(idx, key)
-            else:
-                self.execute_preset_by_index(idx)
-
         try:
-            # Use QTimer.singleShot with 0 ms to enqueue on the main thread
-            QTimer.singleShot(0, _run)
+            # Signal-Emission wird von Qt in den Hauptthread eingereiht
+            self._preset_hotkey_fired.emit(index, shortcut_key or "")
         except Exception:
-            # Last-resort: call directly
-            try:
-                _run()
-            except Exception:
-                pass
+            pass
+
+    def _on_preset_hotkey_fired(self, index, shortcut_key):
+        if shortcut_key:
+            self.on_preset_shortcut_triggered(index, shortcut_key)
+        else:
+            self.execute_preset_by_index(index)
 
     def _read_clipboard_text(self, triggered_shortcut: Optional[str] = None) -> Optional[str]:
         """Liest Text aus der Zwischenablage und zeigt bei Fehlern einheitliche Hinweise an."""
         try:
-            return pyperclip.paste()
+            return read_clipboard()
         except Exception as exc:
             if triggered_shortcut:
                 shortcut = format_shortcut_for_display(triggered_shortcut)
@@ -867,13 +1314,13 @@ class APIManager(QMainWindow):
                 QSystemTrayIcon.MessageIcon.Critical,
                 5000
             )
-            print(f"[DEBUG] Fehler beim Lesen der Zwischenablage: {exc}")
+            log.debug("Fehler beim Lesen der Zwischenablage: %s", exc)
             return None
 
     def copy_to_clipboard(self, text: str, *, success_toast: Optional[str] = None, error_context: str = "Text") -> bool:
         """Kopiert Text in die Zwischenablage und behandelt Fehler konsistent."""
         try:
-            pyperclip.copy(text)
+            write_clipboard(text)
         except Exception as exc:
             message = f"❌ {error_context} konnte nicht kopiert werden: {exc}"
             self.show_toast(message)
@@ -883,14 +1330,16 @@ class APIManager(QMainWindow):
                 QSystemTrayIcon.MessageIcon.Critical,
                 4500
             )
-            print(f"[DEBUG] Fehler beim Schreiben in die Zwischenablage: {exc}")
+            log.debug("Fehler beim Schreiben in die Zwischenablage: %s", exc)
             return False
 
         if success_toast:
             self.show_toast(success_toast, 3000)
         return True
 
-    def _convert_to_pynput_hotkey(self, qt_shortcut: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _convert_to_pynput_hotkey(qt_shortcut: str) -> str:
         """Convert a canonicalized Qt-like shortcut (e.g. 'Ctrl+Alt+Z') to a pynput GlobalHotKeys string ('<ctrl>+<alt>+z')."""
         if not qt_shortcut:
             return ""
@@ -898,36 +1347,23 @@ class APIManager(QMainWindow):
         if not parts:
             return ""
 
-        mod_map = {
-            'Ctrl': 'ctrl', 'Control': 'ctrl', 'Shift': 'shift', 'Alt': 'alt', 'Option': 'alt',
-            'Meta': 'cmd', 'Cmd': 'cmd', 'AltGr': 'alt_gr'
-        }
-
-        tokens = []
-        for p in parts[:-1]:
-            low = mod_map.get(p, p).lower()
-            # wrap standard modifiers
-            if low in ('ctrl', 'shift', 'alt', 'cmd'):
-                tokens.append(f"<{low}>")
-            else:
-                tokens.append(f"<{low}>")
+        tokens = [PYNPUT_MODIFIERS.get(p) or f"<{p.lower()}>" for p in parts[:-1]]
 
         key = parts[-1]
         # single character keys -> lower
         if len(key) == 1:
             key_token = key.lower()
         else:
-            # Named keys: try to map common ones
-            named = {
-                'Enter': 'enter', 'Return': 'enter', 'Space': 'space', 'Tab': 'tab',
-                'Backspace': 'backspace', 'Delete': 'delete', 'Escape': 'esc',
-                'Esc': 'esc'
-            }
-            key_token = named.get(key, key.lower())
+            key_token = PYNPUT_NAMED_KEYS.get(key, key.lower())
 
         tokens.append(key_token)
         return '+'.join(tokens)
 
+    def _schedule_listener_update(self):
+        """Fasst mehrere Hotkey-Änderungen zu einem einzigen Listener-Neustart zusammen."""
+        if PYNPUT_AVAILABLE and self.global_hotkeys_supported:
+            self._listener_timer.start()
+
     def _update_pynput_listener(self):
         """Starts or restarts the pynput GlobalHotKeys listener with current _global_hotkey_map."""
         # Nur starten, wenn pynput verfügbar ist
@@ -951,15 +1387,20 @@ class APIManager(QMainWindow):
         if not self._global_hotkey_map:
             return
 
+        keyboard = _load_pynput_keyboard()
+        if keyboard is None:
+            self.global_hotkeys_supported = False
+            return
+
         try:
-            self._pynput_listener = _pynput_keyboard.GlobalHotKeys(self._global_hotkey_map)
+            self._pynput_listener = keyboard.GlobalHotKeys(self._global_hotkey_map)
             # run listener in a daemon thread
             threading.Thread(target=self._pynput_listener.start, daemon=True).start()
         except Exception as e:
-            print(f"[DEBUG] Failed to start pynput listener: {e}", file=sys.stderr)
+            log.debug("Failed to start pynput listener: %s", e)
 
     def _register_global_hotkey(self, qt_shortcut: str, preset_index: int, canonical: str):
-        """Adds or updates the mapping used by the pynput listener and restarts it."""
+        """Adds or updates the mapping used by the pynput listener and schedules a restart."""
         # Wenn kein pynput vorhanden oder kein Shortcut-String, abbrechen
         if not PYNPUT_AVAILABLE or not qt_shortcut:
             return
@@ -971,6 +1412,11 @@ class APIManager(QMainWindow):
         if not pynput_hotkey:
             return
 
+        # Gleiche Zuordnung bereits aktiv: Listener nicht unnötig neu starten
+        prev = self._global_hotkey_map.get(pynput_hotkey)
+        if prev is not None and getattr(prev, "_binding", None) == (preset_index, canonical):
+            return
+
         # Build callback
         def make_callback(idx, shortcut):
             def _cb():
@@ -978,6 +1424,7 @@ class APIManager(QMainWindow):
                     self.trigger_preset_by_index(idx, shortcut)
                 except Exception:
                     pass
+            _cb._binding = (idx, shortcut)
             return _cb
 
         # Remove existing mapping for the same canonical shortcut
@@ -989,11 +1436,11 @@ class APIManager(QMainWindow):
                 except Exception:
                     pass
 
-        # Store mapping and restart listener
+        # Store mapping and schedule a listener restart
         self._global_hotkey_map[pynput_hotkey] = make_callback(preset_index, canonical)
         if canonical:
             self._shortcut_to_pynput[canonical] = pynput_hotkey
-        self._update_pynput_listener()
+        self._schedule_listener_update()
 
     def _register_visibility_global_hotkey(self, qt_shortcut: str):
         """Registriert den Sichtbarkeits-Shortcut auch global via pynput."""
@@ -1024,7 +1471,7 @@ class APIManager(QMainWindow):
                 pass
 
         self._global_hotkey_map[pynput_hotkey] = _cb
-        self._update_pynput_listener()
+        self._schedule_listener_update()
 
     def _unregister_visibility_global_hotkey(self):
         if not PYNPUT_AVAILABLE or not self.global_hotkeys_supported:
@@ -1035,57 +1482,36 @@ class APIManager(QMainWindow):
             except Exception:
                 pass
         self._visibility_pynput_key = None
-        self._update_pynput_listener()
+        self._schedule_listener_update()
+
+    def _set_app_event_filter(self, needed: bool):
+        """Installiert oder entfernt den App-weiten eventFilter nur bei Zustandswechsel."""
+        if needed == self._event_filter_installed:
+            return
+        app = QApplication.instance()
+        if not app:
+            return
+        if needed:
+            app.installEventFilter(self)
+        else:
+            app.removeEventFilter(self)
+        self._event_filter_installed = needed
 
     def eventFilter(self, obj, event):
         # Intercept key events to handle visibility shortcut reliably while app is running.
-        if event.type() == QEvent.Type.KeyPress and self.visibility_shortcut_parsed:
-            mods_set, key_str = self.visibility_shortcut_parsed
-
-            # Compare modifiers
-            ev_mods = set()
-            if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-                ev_mods.add('Ctrl')
-            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
-                ev_mods.add('Shift')
-            if event.modifiers() & Qt.KeyboardModifier.AltModifier:
-                ev_mods.add('Alt')
-            if event.modifiers() & Qt.KeyboardModifier.MetaModifier:
-                ev_mods.add('Meta')
-
-            # Key compare (letters/digits)
-            key_name = None
-            try:
-                # Letters and digits: Qt.Key_A..Qt.Key_Z, Qt.Key_0..Qt.Key_9
-                val = event.key()
-                if Qt.Key_A <= val <= Qt.Key_Z:
-                    key_name = chr(val)
-                elif Qt.Key_0 <= val <= Qt.Key_9:
-                    key_name = chr(val)
-                else:
-                    # Fallback: map common keys
-                    common = {
-                        Qt.Key_Return: 'Enter', Qt.Key_Enter: 'Enter', Qt.Key_Space: 'Space', Qt.Key_Tab: 'Tab',
-                        Qt.Key_Backspace: 'Backspace', Qt.Key_Delete: 'Delete', Qt.Key_Escape: 'Escape'
-                    }
-                    key_name = common.get(val, None)
-            except Exception:
-                key_name = None
-
-            if key_name:
-                # Normalize to uppercase single-char if necessary
-                if len(key_name) == 1:
-                    key_name = key_name.upper()
-
-                if ev_mods == mods_set and key_name == key_str:
-                    # Trigger toggle and consume event
-                    try:
-                        self.toggle_visibility()
-                    except Exception:
-                        pass
-                    return True
+        # Der Filter sieht jedes Event der App; ohne Shortcut oder bei anderen Events sofort raus.
+        if not self._shortcut_dispatch or event.type() != _KEY_PRESS_EVENT:
+            return False
 
-        return super().eventFilter(obj, event)
+        # Ein Dict-Zugriff mit (Modifier-Maske, Qt-Key) statt Set-Aufbau pro Tastendruck
+        key = event.key()
+        mods = event.modifiers().value & SHORTCUT_MODIFIER_MASK
+        callback = self._shortcut_dispatch.get((mods, KEY_ALIASES.get(key, key)))
+        if callback:
+            # Trigger callback and consume event
+            callback()
+            return True
+        return False
 
     def create_top_nav(self):
         self.top_nav = QWidget()
@@ -1098,7 +1524,7 @@ class APIManager(QMainWindow):
 
         title = QLabel("PromptPilot")
         title.setObjectName("app_title")
-        title.setFont(QFont(APP_FONT_FAMILY, 22, QFont.Weight.Bold))
+        title.setFont(_FONT_TITLE)
         layout.addWidget(title)
 
         # Separator
@@ -1151,7 +1577,7 @@ class APIManager(QMainWindow):
 
         nav_label = QLabel("NAVIGATION")
         nav_label.setObjectName("nav_label")
-        nav_label.setFont(QFont(APP_FONT_FAMILY, 11, QFont.Weight.Bold))
+        nav_label.setFont(_FONT_NAV_LABEL)
         nav_layout.addWidget(nav_label)
 
         nav_layout.addSpacing(8)
@@ -1165,9 +1591,7 @@ class APIManager(QMainWindow):
 
         layout.addWidget(nav_container)
 
-        self.nav_presets.setProperty("active", True)
-        self.nav_presets.style().unpolish(self.nav_presets)
-        self.nav_presets.style().polish(self.nav_presets)
+        set_style_property(self.nav_presets, "active", True)
 
         bottom = QWidget()
         bottom.setObjectName("sidebar_bottom")
@@ -1176,12 +1600,12 @@ class APIManager(QMainWindow):
 
         info = QLabel("PromptPilot v2.0")
         info.setObjectName("sidebar_info")
-        info.setFont(QFont(APP_FONT_FAMILY, 10))
+        info.setFont(_FONT_SIDEBAR_INFO)
         bottom_layout.addWidget(info)
 
         authors = QLabel("by Cian & Malik")
         authors.setObjectName("sidebar_authors")
-        authors.setFont(QFont(APP_FONT_FAMILY, 9))
+        authors.setFont(_FONT_SIDEBAR_AUTHORS)
         bottom_layout.addWidget(authors)
 
         layout.addWidget(bottom)
@@ -1191,25 +1615,29 @@ class APIManager(QMainWindow):
         btn.setObjectName("nav_button")
         btn.setFixedHeight(48)
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn.setToolTip(f"Wechsle zu {text} ({MODIFIER_KEY_DISPLAY}+{page + 1})")
-        btn.clicked.connect(lambda: self.change_page(page))
+        btn.setToolTip(NAV_TOOLTIP_TEMPLATE.format(text, page + 1))
+        btn.clicked.connect(partial(self.change_page, page))
         return btn
 
     def change_page(self, page_index):
         if page_index == self.current_page_index:
             return
+        if page_index == 1:
+            self._ensure_credentials_page()
         self.page_stack.setCurrentIndex(page_index)
         self.update_nav_buttons(page_index)
         self.current_page_index = page_index
 
-    def update_nav_buttons(self, active_index):
-        self.nav_presets.setProperty("active", active_index == 0)
-        self.nav_credentials.setProperty("active", active_index == 1)
+    def _ensure_credentials_page(self):
+        """Erstellt die API-Einstellungsseite beim ersten Aufruf."""
+        if self.credentials_page is None:
+            self.credentials_page = CredentialsPage(self)
+            self.page_stack.addWidget(self.credentials_page)
+        return self.credentials_page
 
-        self.nav_presets.style().unpolish(self.nav_presets)
-        self.nav_presets.style().polish(self.nav_presets)
-        self.nav_credentials.style().unpolish(self.nav_credentials)
-        self.nav_credentials.style().polish(self.nav_credentials)
+    def update_nav_buttons(self, active_index):
+        set_style_property(self.nav_presets, "active", active_index == 0)
+        set_style_property(self.nav_credentials, "active", active_index == 1)
 
     def setup_shortcuts(self):
         # Keine festen Navigation-Shortcuts mehr. Nutzer kann eigene Shortcuts
@@ -1217,7 +1645,9 @@ class APIManager(QMainWindow):
         return
     def load_saved_shortcuts(self):
         """Lädt beim Start alle in presets.json gespeicherten Shortcuts und registriert sie."""
-        for idx, preset in enumerate(self.backend.presets):
+        # Jede Registrierung plant den Listener-Neustart nur ein; er läuft einmal danach
+        register = self.register_preset_shortcut
+        for idx, preset in enumerate(self.presets):
             shortcut = preset.get('shortcut', '')
             if not shortcut:
                 continue
@@ -1225,7 +1655,7 @@ class APIManager(QMainWindow):
                 canonical = canonicalize_shortcut(shortcut)
             except ValueError:
                 continue
-            self.register_preset_shortcut(canonical, idx, silent=True)
+            register(canonical, idx, silent=True)
 
         # Sichtbarkeits-Shortcut aus Einstellungen laden
         vis = self.backend.get_setting('show_shortcut', '')
@@ -1234,13 +1664,18 @@ class APIManager(QMainWindow):
 
     def reload_shortcuts(self):
         """Entfernt alle registrierten Preset-Shortcuts und lädt sie aus der Persistenz neu."""
-        for action in list(self.preset_shortcut_actions.values()):
-            try:
+        # Aktionen gesammelt abbauen, damit nicht jede einzeln ein Update auslöst
+        self.setUpdatesEnabled(False)
+        try:
+            for action in self.preset_shortcut_actions.values():
+                action.setEnabled(False)
                 self.removeAction(action)
-            except Exception:
-                pass
-        self.preset_shortcut_actions.clear()
-        self.preset_shortcuts.clear()
+                action.deleteLater()
+            self.preset_shortcut_actions.clear()
+            self.preset_shortcuts.clear()
+            self._index_to_shortcut.clear()
+        finally:
+            self.setUpdatesEnabled(True)
 
         if self.global_hotkeys_supported:
             if self._pynput_listener:
@@ -1264,7 +1699,7 @@ class APIManager(QMainWindow):
                 del self._global_hotkey_map[pynput_key]
             except Exception:
                 pass
-            self._update_pynput_listener()
+            self._schedule_listener_update()
 
     def register_preset_shortcut(self, shortcut_key, preset_index, *, silent: bool = False):
         """Registriert einen Shortcut für ein Preset mit korrekter QKeySequence-Unterstützung"""
@@ -1272,63 +1707,67 @@ class APIManager(QMainWindow):
             return False
 
         try:
-            canonical = canonicalize_shortcut(shortcut_key)
+            spec = ShortcutSpec.from_raw(shortcut_key)
         except ValueError as exc:
             if not silent:
                 self.show_toast(str(exc))
             return False
+        canonical, qt_shortcut = spec.canonical, spec.qt
 
         existing = self.preset_shortcuts.get(canonical)
         if existing is not None and existing != preset_index:
             if not silent:
-                conflict = self.backend.presets[existing]["name"] if existing < len(self.backend.presets) else "anderes Preset"
+                conflict = self._preset_name(existing, "anderes Preset")
                 self.show_toast(f"⚠️ Shortcut bereits vergeben ({format_shortcut_for_display(canonical)} → {conflict})")
             return False
 
-        # Entferne alte Shortcuts für dieses Preset
-        for key, idx in list(self.preset_shortcuts.items()):
-            if idx == preset_index and key != canonical:
-                if key in self.preset_shortcut_actions:
-                    try:
-                        self.removeAction(self.preset_shortcut_actions[key])
-                    except Exception:
-                        pass
-                    del self.preset_shortcut_actions[key]
-                del self.preset_shortcuts[key]
-                self._unregister_global_hotkey(key)
-
-        qt_shortcut = canonicalize_shortcut_for_qt(canonical)
-        print(f"[DEBUG] Registriere Shortcut: {canonical} -> QKeySequence: {qt_shortcut}")
+        # Entferne alten Shortcut für dieses Preset (Reverse-Index statt Scan)
+        old = self._index_to_shortcut.get(preset_index)
+        if old and old != canonical:
+            old_action = self.preset_shortcut_actions.pop(old, None)
+            if old_action:
+                old_action.setEnabled(False)
+                self.removeAction(old_action)
+                old_action.deleteLater()
+            self.preset_shortcuts.pop(old, None)
+            self._unregister_global_hotkey(old)
+
+        log.debug("Registriere Shortcut: %s -> QKeySequence: %s", canonical, qt_shortcut)
 
         # Entferne evtl. vorhandene Action (z.B. gleiche Kombination)
-        if canonical in self.preset_shortcut_actions:
-            try:
-                self.removeAction(self.preset_shortcut_actions[canonical])
-            except Exception:
-                pass
+        existing_action = self.preset_shortcut_actions.pop(canonical, None)
+        if existing_action:
+            existing_action.setEnabled(False)
+            self.removeAction(existing_action)
+            existing_action.deleteLater()
 
         action = QAction(self)
         action.setShortcut(QKeySequence(qt_shortcut))
         action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
-        action.triggered.connect(lambda idx=preset_index, key=canonical: self.on_preset_shortcut_triggered(idx, key))
+        action.triggered.connect(partial(self.on_preset_shortcut_triggered, preset_index, canonical))
         self.addAction(action)
 
         self.preset_shortcuts[canonical] = preset_index
         self.preset_shortcut_actions[canonical] = action
+        self._index_to_shortcut[preset_index] = canonical
 
-        print(f"[DEBUG] Shortcut registriert. Aktive Shortcuts: {self.preset_shortcuts}")
+        log.debug("Shortcut registriert. Aktive Shortcuts: %s", self.preset_shortcuts)
         if not silent:
             self.show_toast(f"✓ Shortcut {format_shortcut_for_display(canonical)} aktiviert")
 
         # Wenn pynput verfügbar, registriere denselben Shortcut global
         try:
-            qt_shortcut = canonicalize_shortcut_for_qt(canonical)
             self._register_global_hotkey(qt_shortcut, preset_index, canonical)
         except Exception:
-            pass
+            log.exception("Globaler Hotkey %s konnte nicht registriert werden", canonical)
 
         return True
 
+    def _preset_name(self, idx, fallback="Preset"):
+        """Gibt den Namen des Presets zum Index zurück oder einen Platzhalter."""
+        presets = self.presets
+        return presets[idx]["name"] if 0 <= idx < len(presets) else fallback
+
     def toggle_theme(self):
         """Wechselt zwischen Dark und Light Mode und speichert die Einstellung"""
         new_theme = 'light' if self.current_theme == 'dark' else 'dark'
@@ -1339,6 +1778,9 @@ class APIManager(QMainWindow):
         except Exception:
             pass
         self.apply_stylesheets(new_theme)
+        self.home_page.set_theme(new_theme)
+        # Neues Stylesheet kann die Toast-Größe ändern
+        self._toast_key = None
         self.show_toast(f"Theme: {new_theme}")
 
     def set_visibility_shortcut(self):
@@ -1348,11 +1790,7 @@ class APIManager(QMainWindow):
             shortcut = dialog.get_shortcut()
             if shortcut:
                 if shortcut in self.preset_shortcuts:
-                    conflict = self.preset_shortcuts[shortcut]
-                    if conflict < len(self.backend.presets):
-                        name = self.backend.presets[conflict]["name"]
-                    else:
-                        name = "Preset"
+                    name = self._preset_name(self.preset_shortcuts[shortcut])
                     self.show_toast(f"⚠️ Shortcut kollidiert mit '{name}'")
                     return
 
@@ -1371,16 +1809,16 @@ class APIManager(QMainWindow):
             return False
 
         try:
-            canonical = canonicalize_shortcut(shortcut_key)
+            spec = ShortcutSpec.from_raw(shortcut_key)
         except ValueError as exc:
             if not silent:
                 self.show_toast(str(exc))
             return False
+        canonical, qt_shortcut = spec.canonical, spec.qt
 
         if canonical in self.preset_shortcuts:
             if not silent:
-                conflict_idx = self.preset_shortcuts[canonical]
-                conflict = self.backend.presets[conflict_idx]["name"] if conflict_idx < len(self.backend.presets) else "Preset"
+                conflict = self._preset_name(self.preset_shortcuts[canonical])
                 self.show_toast(f"⚠️ Shortcut bereits als Preset genutzt ({format_shortcut_for_display(canonical)} → {conflict})")
             return False
 
@@ -1395,15 +1833,13 @@ class APIManager(QMainWindow):
         # bevor ein neuer gesetzt wird.
         self._unregister_visibility_global_hotkey()
 
-        qt_shortcut = canonicalize_shortcut_for_qt(canonical)
-
         # Keep parsed representation to match key events in the eventFilter
-        parts = [p.strip() for p in canonical.split('+') if p.strip()]
-        if parts:
-            mods = set(parts[:-1])
-            key = parts[-1]
-            self.visibility_shortcut_parsed = (mods, key)
+        if spec.key:
+            if self.visibility_shortcut_parsed:
+                self._shortcut_dispatch.pop(self.visibility_shortcut_parsed, None)
+            self.visibility_shortcut_parsed = (spec.mods, spec.key)
             self.visibility_shortcut_raw = canonical
+            self._shortcut_dispatch[self.visibility_shortcut_parsed] = self.toggle_visibility
 
         action = QAction(self)
         try:
@@ -1416,10 +1852,16 @@ class APIManager(QMainWindow):
             # Fallback: still store parsed shortcut and rely on eventFilter
             self.visibility_action = None
 
+        # Die QAction deckt den Shortcut ab; der eventFilter wird nur noch als Fallback
+        # gebraucht oder wenn Return/Enter gleichwertig sein sollen (KEY_ALIASES)
+        self._set_app_event_filter(
+            self.visibility_action is None or spec.key in KEY_ALIASES.values()
+        )
+
         try:
             self._register_visibility_global_hotkey(qt_shortcut)
         except Exception:
-            pass
+            log.exception("Globaler Sichtbarkeits-Hotkey %s konnte nicht registriert werden", canonical)
 
         return True
 
@@ -1436,82 +1878,89 @@ class APIManager(QMainWindow):
             self.activateWindow()
 
     def show_shortcuts_overview(self):
-        dialog = ShortcutOverviewDialog(self, self.preset_shortcuts, self.backend.presets)
+        dialog = self._shortcuts_overview
+        # Nur neu aufbauen, wenn sich Presets oder Shortcuts seit dem letzten Öffnen geändert haben
+        key = (self.backend.presets_version, tuple(sorted(self.preset_shortcuts.items())))
+        if dialog is None or self._shortcuts_overview_key != key:
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = ShortcutOverviewDialog(self, self.preset_shortcuts, self.presets)
+            self._shortcuts_overview = dialog
+            self._shortcuts_overview_key = key
         dialog.exec()
 
 
     def on_preset_shortcut_triggered(self, preset_index, shortcut_key):
         """Wird aufgerufen wenn ein Preset-Shortcut gedrückt wird"""
-        print(f"[DEBUG] ============================================")
-        print(f"[DEBUG] Shortcut {shortcut_key} ausgelöst für Preset {preset_index}")
-        print(f"[DEBUG] ============================================")
+        log.debug("Shortcut %s ausgelöst für Preset %s", shortcut_key, preset_index)
+        self._dispatch_preset(preset_index, triggered_shortcut=shortcut_key, source="shortcut")
 
-        if preset_index < 0 or preset_index >= len(self.backend.presets):
-            self.show_toast("❌ Preset nicht gefunden")
-            self._notify_tray(
-                "Preset nicht gefunden",
-                f"Der Shortcut {format_shortcut_for_display(shortcut_key)} verweist auf ein unbekanntes Preset.",
-                QSystemTrayIcon.MessageIcon.Critical,
-                4000
-            )
-            print(f"[DEBUG] Fehler: Preset-Index {preset_index} außerhalb des Bereichs")
-            return
-
-        preset = self.backend.presets[preset_index]
-        print(f"[DEBUG] Preset gefunden: {preset['name']}")
-
-        clipboard_text = self._read_clipboard_text(triggered_shortcut=shortcut_key)
-        if clipboard_text is None:
-            return
-        print(f"[DEBUG] Zwischenablage gelesen: {len(clipboard_text) if clipboard_text else 0} Zeichen")
+    def execute_preset_by_index(self, preset_index, source: Optional[str] = None):
+        self._dispatch_preset(preset_index, source=source)
 
-        if not clipboard_text:
-            self.show_toast(f"ℹ️ Zwischenablage ist leer")
-            print(f"[DEBUG] Zwischenablage ist leer")
-            # Zeige System-Benachrichtigung
-            self._notify_tray(
-                "Zwischenablage leer",
-                f"Kopiere zuerst einen Text, dann drücke {format_shortcut_for_display(shortcut_key)}",
-                QSystemTrayIcon.MessageIcon.Warning,
-                5000
-            )
+    def _dispatch_preset(self, preset_index, *, triggered_shortcut: Optional[str] = None, source: Optional[str] = None):
+        """Gemeinsamer Ablauf für Shortcut und Klick: Preset prüfen, Zwischenablage lesen, Ausführung starten."""
+        presets = self.presets
+        if not 0 <= preset_index < len(presets):
+            if triggered_shortcut:
+                self.show_toast("❌ Preset nicht gefunden")
+                self._notify_tray(
+                    "Preset nicht gefunden",
+                    f"Der Shortcut {format_shortcut_for_display(triggered_shortcut)} verweist auf ein unbekanntes Preset.",
+                    QSystemTrayIcon.MessageIcon.Critical,
+                    4000
+                )
+                log.debug("Fehler: Preset-Index %s außerhalb des Bereichs", preset_index)
+            else:
+                self.show_toast("Preset nicht gefunden")
             return
 
-        print(f"[DEBUG] Starte Preset-Verarbeitung...")
-        self.show_toast(f"⚙️ Verarbeite mit '{preset['name']}'...")
-        self.home_page.show_loading()
-        QTimer.singleShot(
-            100,
-            lambda p=preset, text=clipboard_text, key=shortcut_key: self._execute_preset_async(
-                p, text, triggered_shortcut=key, source="shortcut"
-            )
-        )
-
-    def execute_preset_by_index(self, preset_index, source: Optional[str] = None):
-        if preset_index < 0 or preset_index >= len(self.backend.presets):
-            self.show_toast("Preset nicht gefunden")
-            return
+        preset = presets[preset_index]
+        log.debug("Preset gefunden: %s", preset["name"])
 
-        preset = self.backend.presets[preset_index]
-        clipboard_text = self._read_clipboard_text()
+        clipboard_text = self._read_clipboard_text(triggered_shortcut=triggered_shortcut)
         if clipboard_text is None:
             return
+        log.debug("Zwischenablage gelesen: %d Zeichen", len(clipboard_text))
 
         if not clipboard_text:
-            self.show_toast("Zwischenablage ist leer")
+            log.debug("Zwischenablage ist leer")
+            if triggered_shortcut:
+                self.show_toast("ℹ️ Zwischenablage ist leer")
+                # Zeige System-Benachrichtigung
+                self._notify_tray(
+                    "Zwischenablage leer",
+                    f"Kopiere zuerst einen Text, dann drücke {format_shortcut_for_display(triggered_shortcut)}",
+                    QSystemTrayIcon.MessageIcon.Warning,
+                    5000
+                )
+            else:
+                self.show_toast("Zwischenablage ist leer")
             return
 
-        self.show_toast(f"Verarbeite mit '{preset['name']}'...")
+        log.debug("Starte Preset-Verarbeitung...")
+        if triggered_shortcut:
+            self.show_toast(f"⚙️ Verarbeite mit '{preset['name']}'...")
+        else:
+            self.show_toast(f"Verarbeite mit '{preset['name']}'...")
         self.home_page.show_loading()
-        QTimer.singleShot(
-            100,
-            lambda p=preset, text=clipboard_text, src=source: self._execute_preset_async(p, text, source=src)
-        )
+        self._execute_preset_async(preset, clipboard_text, triggered_shortcut=triggered_shortcut, source=source)
 
     def _execute_preset_async(self, preset, clipboard_text, triggered_shortcut: Optional[str] = None, source: Optional[str] = None):
-        """Führt das Preset asynchron aus"""
-        print(f"[DEBUG] Starte Preset-Ausführung: {preset['name']}")
-        result = self.backend.execute_preset(preset["name"], clipboard_text)
+        """Führt das Preset asynchron in einem Worker-Thread aus"""
+        log.debug("Starte Preset-Ausführung: %s", preset["name"])
+        task = _PresetWorker(self.backend, preset["name"], clipboard_text)
+        self._pending_preset_tasks.add(task)
+        task.signals.finished.connect(
+            lambda result, task=task: self._on_preset_finished(
+                task, preset, clipboard_text, triggered_shortcut, source, result
+            )
+        )
+        QThreadPool.globalInstance().start(task)
+
+    def _on_preset_finished(self, task, preset, clipboard_text, triggered_shortcut: Optional[str], source: Optional[str], result):
+        """Verarbeitet das Ergebnis einer Preset-Ausführung im Qt-Hauptthread"""
+        self._pending_preset_tasks.discard(task)
 
         if result.get("status") == "success":
             response = result.get("response", "")
@@ -1536,7 +1985,7 @@ class APIManager(QMainWindow):
                 )
         else:
             error_msg = result.get("message", "Unbekannter Fehler")
-            print(f"[DEBUG] Fehler bei Preset-Ausführung: {error_msg}")
+            log.debug("Fehler bei Preset-Ausführung: %s", error_msg)
             self.show_toast(f"❌ Fehler: {error_msg}", 3000)
             self.home_page.show_error(error_msg)
             should_notify = bool(triggered_shortcut) or self.isMinimized() or source == "tray"
@@ -1552,193 +2001,65 @@ class APIManager(QMainWindow):
                 )
 
     def show_toast(self, message, duration=2000):
-        self.toast_label.setText(message)
-        self.toast_label.adjustSize()
-        self.toast_label.move(
-            (self.width() - self.toast_label.width()) // 2,
-            self.height() - self.toast_label.height() - 40
-        )
-        self.toast_label.show()
+        label = self.toast_label
+        key = (message, self.width(), self.height())
+        # Gleicher Text bei gleicher Fenstergröße: Geometrie ist noch gültig, kein neues Layout
+        if key != self._toast_key:
+            label.setUpdatesEnabled(False)
+            label.setText(message)
+            label.adjustSize()
+            label.move(
+                (key[1] - label.width()) // 2,
+                key[2] - label.height() - 40
+            )
+            label.setUpdatesEnabled(True)
+            self._toast_key = key
+        if label.isVisible():
+            label.raise_()
+        else:
+            label.show()
         self.toast_timer.start(duration)
 
     def hide_toast(self):
         self.toast_label.hide()
-        self.toast_timer.stop()
 
     def apply_stylesheets(self, theme='dark'):
         """Wendet Stylesheet und Palette für das gewählte Theme an (dark/light)."""
-        accent = "#007aff"
-        success = "#34c759"
-        danger = "#ff3b30"
-        font_stack = f"'{APP_FONT_FAMILY}', 'SF Pro Text', 'SF Pro Display', '-apple-system', 'Helvetica Neue', 'Segoe UI', sans-serif"
+        if theme == self._applied_theme:
+            return
 
         QApplication.setStyle("Fusion")
         app = QApplication.instance()
 
-        if theme == 'dark':
-            palette = QPalette()
-            palette.setColor(QPalette.ColorRole.Window, QColor(28, 28, 30))
-            palette.setColor(QPalette.ColorRole.WindowText, QColor(240, 240, 240))
-            palette.setColor(QPalette.ColorRole.Base, QColor(44, 44, 46))
-            palette.setColor(QPalette.ColorRole.AlternateBase, QColor(58, 58, 60))
-            palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(240, 240, 240))
-            palette.setColor(QPalette.ColorRole.ToolTipText, QColor(12, 12, 12))
-            palette.setColor(QPalette.ColorRole.Text, QColor(245, 245, 247))
-            palette.setColor(QPalette.ColorRole.Button, QColor(44, 44, 46))
-            palette.setColor(QPalette.ColorRole.ButtonText, QColor(245, 245, 247))
-            palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-            palette.setColor(QPalette.ColorRole.Link, QColor(0, 122, 255))
-            palette.setColor(QPalette.ColorRole.Highlight, QColor(0, 122, 255))
-            palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-            if app:
-                app.setPalette(palette)
-            self.setPalette(palette)
-
-            base_styles = f"""
-                QWidget {{ background-color: #1c1c1e; color: #f5f5f7; font-family: {font_stack}; }}
-                #top_nav {{ background-color: rgba(28,28,30,0.92); border-bottom: 1px solid rgba(255,255,255,0.08); border-radius: 18px; }}
-                #top_nav QLabel#app_title {{ color: #f5f5f7; letter-spacing: 0.2px; }}
-                #top_nav_separator {{ background-color: rgba(255,255,255,0.12); width: 1px; }}
-                #sidebar {{ background-color: #2c2c2e; border: 1px solid rgba(255,255,255,0.05); border-radius: 20px; }}
-                #sidebar_info, #sidebar_authors {{ color: rgba(255,255,255,0.55); }}
-                #sidebar_bottom {{ background-color: transparent; border-top: 1px solid rgba(255,255,255,0.06); border-radius: 14px; }}
-                QPushButton#nav_button {{ background: transparent; border: none; color: rgba(255,255,255,0.72); text-align: left; padding: 10px 16px; border-radius: 12px; }}
-                QPushButton#nav_button[active="true"] {{ background-color: rgba(255,255,255,0.12); color: #ffffff; font-weight: 600; }}
-                QPushButton#nav_button:hover {{ background-color: rgba(255,255,255,0.08); }}
-                .content_card, .preset_card, .shortcut_card, #result_panel {{ background-color: rgba(44,44,46,0.9); border-radius: 18px; border: 1px solid rgba(255,255,255,0.08); }}
-                #page_stack {{ background: transparent; }}
-
-                /* Blaue Button-Stile */
-                QPushButton#btn_primary,
-                QPushButton#btn_secondary,
-                QPushButton#btn_success,
-                QPushButton#btn_danger,
-                QPushButton#btn_warning {{
-                    background-color: #007aff; /* Blau */
-                    color: #ffffff;
-                }}
-                QPushButton#btn_primary:hover,
-                QPushButton#btn_secondary:hover,
-                QPushButton#btn_success:hover,
-                QPushButton#btn_danger:hover,
-                QPushButton#btn_warning:hover {{
-                    background-color: #0a84ff; /* Dunkleres Blau beim Hover */
-                }}
-
-                QPushButton#btn_ghost {{ background-color: transparent; color: #007aff; padding: 6px 12px; border-radius: 10px; }}
-                QPushButton#btn_ghost:hover {{ background-color: rgba(255,255,255,0.08); }}
-                QLineEdit, QTextEdit, QComboBox, QKeySequenceEdit {{ background: rgba(58,58,60,0.95); border: 1px solid rgba(255,255,255,0.12); color: #f5f5f7; border-radius: 12px; selection-background-color: #007aff; selection-color: #ffffff; }}
-                QLineEdit[error="true"], QTextEdit[error="true"], QKeySequenceEdit[error="true"] {{ border: 1px solid #ff453a; }} /* Danger-Farbe beibehalten, da es keine Schaltfläche ist */
-                QLabel#section_title {{ color: #ffffff; }}
-                QLabel#section_subtitle {{ color: rgba(255,255,255,0.65); }}
-                QLabel#input_label {{ color: rgba(255,255,255,0.82); font-weight: 600; letter-spacing: 0.2px; }}
-                QLabel#hint_text {{ color: rgba(255,255,255,0.55); font-size: 13px; }}
-                QLabel#error_label {{ color: #ff453a; font-size: 13px; }} /* Danger-Farbe beibehalten */
-                QLabel#preset_header {{ color: #ffffff; font-size: 17px; font-weight: 700; }}
-                QLabel#preset_meta, QLabel#presets_counter {{ color: rgba(255,255,255,0.65); font-size: 13px; }}
-                QLabel#preset_prompt {{ color: rgba(255,255,255,0.86); font-size: 13px; }}
-                QLabel#shortcut_badge {{ background-color: rgba(255,255,255,0.12); color: #ffffff; border-radius: 999px; padding: 4px 12px; font-weight: 600; }}
-
-                /* Shortcut Chip auf Blau geändert */
-                QPushButton#shortcut_chip {{ background-color: rgba(0,122,255,0.3); color: #e4f0ff; border: 1px solid rgba(0,122,255,0.55); border-radius: 10px; padding: 6px 12px; font-weight: 700; font-family: 'JetBrains Mono', 'SF Mono', monospace; }}
-                QPushButton#shortcut_chip:hover {{ background-color: rgba(0,122,255,0.45); color: #ffffff; }}
-                QPushButton#shortcut_chip[empty="true"] {{ border: 1px dashed rgba(255,255,255,0.38); background: transparent; color: rgba(228,240,255,0.9); }}
-
-                QLabel#toast {{ background: rgba(0,0,0,0.8); color: #ffffff; padding: 12px 20px; border-radius: 14px; font-weight: 600; }}
-                QLabel#shortcut_key {{ color: #f5f5f7; font-family: 'JetBrains Mono', 'SF Mono', monospace; font-weight: 600; }}
-                QLabel#shortcut_desc {{ color: rgba(255,255,255,0.65); }}
-                QWidget#shortcut_item {{ background-color: rgba(58,58,60,0.9); border-radius: 14px; border: 1px solid rgba(255,255,255,0.04); }}
-                QWidget#empty_state {{ background: transparent; color: rgba(255,255,255,0.6); }}
-                QScrollArea#preset_scroll {{ border: none; background: transparent; }}
-                QSplitter::handle:horizontal {{ width: 2px; background: rgba(255,255,255,0.08); }}
-                QKeySequenceEdit#shortcut_input {{ color: #f5f5f7; }}
-                QFrame#section_divider {{ background-color: rgba(255,255,255,0.12); max-height: 1px; min-height: 1px; }}
-            """
-        else:
-            palette = QPalette()
-            palette.setColor(QPalette.ColorRole.Window, QColor(245, 246, 248))
-            palette.setColor(QPalette.ColorRole.WindowText, QColor(28, 28, 30))
-            palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-            palette.setColor(QPalette.ColorRole.AlternateBase, QColor(242, 242, 247))
-            palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-            palette.setColor(QPalette.ColorRole.ToolTipText, QColor(28, 28, 30))
-            palette.setColor(QPalette.ColorRole.Text, QColor(28, 28, 30))
-            palette.setColor(QPalette.ColorRole.Button, QColor(255, 255, 255))
-            palette.setColor(QPalette.ColorRole.ButtonText, QColor(28, 28, 30))
-            palette.setColor(QPalette.ColorRole.BrightText, QColor(0, 0, 0))
-            palette.setColor(QPalette.ColorRole.Link, QColor(0, 122, 255))
-            palette.setColor(QPalette.ColorRole.Highlight, QColor(0, 122, 255))
-            palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-            if app:
-                app.setPalette(palette)
-            self.setPalette(palette)
-
-            base_styles = f"""
-                QWidget {{ background-color: #f5f5f7; color: #1c1c1e; font-family: {font_stack}; }}
-                #top_nav {{ background-color: rgba(255,255,255,0.9); border-bottom: 1px solid rgba(60,60,67,0.12); border-radius: 18px; }}
-                #top_nav QLabel#app_title {{ color: #1c1c1e; letter-spacing: 0.2px; }}
-                #top_nav_separator {{ background-color: rgba(60,60,67,0.18); width: 1px; }}
-                #sidebar {{ background-color: #ffffff; border: 1px solid rgba(60,60,67,0.12); border-radius: 20px; }}
-                #sidebar_info, #sidebar_authors {{ color: rgba(60,60,67,0.6); }}
-                #sidebar_bottom {{ background-color: rgba(250,250,252,0.8); border-top: 1px solid rgba(60,60,67,0.08); border-radius: 14px; }}
-                QPushButton#nav_button {{ background: transparent; border: none; color: rgba(28,28,30,0.8); text-align: left; padding: 10px 16px; border-radius: 12px; }}
-                QPushButton#nav_button[active="true"] {{ background-color: rgba(0,122,255,0.12); color: #0a84ff; font-weight: 600; }}
-                QPushButton#nav_button:hover {{ background-color: rgba(0,0,0,0.05); }}
-                .content_card, .preset_card, .shortcut_card, #result_panel {{ background-color: #ffffff; border-radius: 18px; border: 1px solid rgba(60,60,67,0.12); }}
-                #page_stack {{ background: transparent; }}
-                QPushButton#btn_primary {{ background-color: {accent}; color: #ffffff; }}
-                QPushButton#btn_primary:hover {{ background-color: #0a84ff; }}
-                QPushButton#btn_secondary {{ background-color: rgba(60,60,67,0.08); color: #1c1c1e; }}
-                QPushButton#btn_secondary:hover {{ background-color: rgba(60,60,67,0.14); }}
-                QPushButton#btn_success {{ background-color: {success}; color: #ffffff; }}
-                QPushButton#btn_danger {{ background-color: {danger}; color: #ffffff; }}
-                QPushButton#btn_warning {{ background-color: rgba(255,149,0,0.28); color: #c93400; }}
-                QPushButton#btn_ghost {{ background-color: transparent; color: {accent}; padding: 6px 12px; border-radius: 10px; }}
-                QPushButton#btn_ghost:hover {{ background-color: rgba(0,122,255,0.08); }}
-                QLineEdit, QTextEdit, QComboBox, QKeySequenceEdit {{ background: #ffffff; border: 1px solid rgba(60,60,67,0.18); color: #1c1c1e; border-radius: 12px; selection-background-color: {accent}; selection-color: #ffffff; }}
-                QLineEdit[error="true"], QTextEdit[error="true"], QKeySequenceEdit[error="true"] {{ border: 1px solid {danger}; }}
-                QLabel#section_title {{ color: #111; }}
-                QLabel#section_subtitle {{ color: rgba(60,60,67,0.75); }}
-                QLabel#input_label {{ color: rgba(28,28,30,0.9); font-weight: 600; letter-spacing: 0.2px; }}
-                QLabel#hint_text {{ color: rgba(60,60,67,0.6); font-size: 13px; }}
-                QLabel#error_label {{ color: {danger}; font-size: 13px; }}
-                QLabel#preset_header {{ color: #111; font-size: 17px; font-weight: 700; }}
-                QLabel#preset_meta, QLabel#presets_counter {{ color: rgba(60,60,67,0.65); font-size: 13px; }}
-                QLabel#preset_prompt {{ color: rgba(28,28,30,0.82); font-size: 13px; }}
-                QLabel#shortcut_badge {{ background-color: rgba(0,122,255,0.12); color: #0a84ff; border-radius: 999px; padding: 4px 12px; font-weight: 600; }}
-                QPushButton#shortcut_chip {{ background-color: rgba(10,132,255,0.12); color: #0a84ff; border: 1px solid rgba(0,122,255,0.35); border-radius: 10px; padding: 6px 12px; font-weight: 700; font-family: 'JetBrains Mono', 'SF Mono', monospace; }}
-                QPushButton#shortcut_chip:hover {{ background-color: rgba(10,132,255,0.2); color: #0060df; }}
-                QPushButton#shortcut_chip[empty="true"] {{ border: 1px dashed rgba(0,122,255,0.35); background: transparent; color: rgba(10,132,255,0.85); }}
-                QLabel#toast {{ background: rgba(28,28,30,0.85); color: #ffffff; padding: 12px 20px; border-radius: 14px; font-weight: 600; }}
-                QLabel#shortcut_key {{ color: #111; font-family: 'JetBrains Mono', 'SF Mono', monospace; font-weight: 600; }}
-                QLabel#shortcut_desc {{ color: rgba(28,28,30,0.6); }}
-                QWidget#shortcut_item {{ background-color: rgba(0,0,0,0.03); border-radius: 14px; border: 1px solid rgba(60,60,67,0.08); }}
-                QWidget#empty_state {{ background: transparent; color: rgba(60,60,67,0.55); }}
-                QScrollArea#preset_scroll {{ border: none; background: transparent; }}
-                QSplitter::handle:horizontal {{ width: 2px; background: rgba(60,60,67,0.12); }}
-                QKeySequenceEdit#shortcut_input {{ color: #1c1c1e; }}
-                QFrame#section_divider {{ background-color: rgba(60,60,67,0.15); max-height: 1px; min-height: 1px; }}
-            """
-
-        common = f"""
-            * {{ font-family: {font_stack}; font-size: 13px; }}
-            QPushButton {{ border: none; border-radius: 12px; font-weight: 600; padding: 10px 18px; }}
-            QLineEdit, QComboBox, QTextEdit, QKeySequenceEdit {{ padding: 10px 14px; font-size: 13px; }}
-            QTextEdit {{ padding: 12px 14px; }}
-        """
+        palette = _palette_for(theme)
+        if app:
+            app.setPalette(palette)
+        self.setPalette(palette)
 
-        try:
-            self.setStyleSheet(base_styles + common)
-        except Exception:
-            self.setStyleSheet(common)
+        # Ein globales Stylesheet auf der QApplication; Kind-Widgets und Dialoge erben es
+        stylesheet = build_stylesheet(theme)
+        if app:
+            app.setStyleSheet(stylesheet)
+        else:
+            self.setStyleSheet(stylesheet)
+        self._applied_theme = theme
 
     @property
     def api_credentials(self):
-        return self.backend.api_credentials
+        backend = self.backend
+        if self._credentials_cache_version != backend.credentials_version:
+            self._credentials_cache = backend.api_credentials
+            self._credentials_cache_version = backend.credentials_version
+        return self._credentials_cache
 
     @property
     def presets(self):
-        return self.backend.presets
+        # Presets nur neu aus der Datei lesen, wenn das Backend seitdem geschrieben hat
+        backend = self.backend
+        if self._presets_cache_version != backend.presets_version:
+            self._presets_cache = backend.presets
+            self._presets_cache_version = backend.presets_version
+        return self._presets_cache
 
 
 class BasePage(QWidget):
@@ -1750,11 +2071,422 @@ class BasePage(QWidget):
         self.main_layout.setSpacing(SECTION_SPACING + 4)
 
 
+def _rgba(r, g, b, a=1.0) -> QColor:
+    return QColor(r, g, b, round(a * 255))
+
+
+# Farben der gezeichneten Preset-Karten (entsprechen den Stylesheet-Regeln des Themes)
+_PRESET_CARD_COLORS = {
+    "dark": {
+        "card": _rgba(44, 44, 46, 0.9),
+        "card_border": _rgba(255, 255, 255, 0.08),
+        "title": QColor("#ffffff"),
+        "meta": _rgba(255, 255, 255, 0.65),
+        "prompt": _rgba(255, 255, 255, 0.86),
+        "chip": _rgba(0, 122, 255, 0.3),
+        "chip_border": _rgba(0, 122, 255, 0.55),
+        "chip_text": QColor("#e4f0ff"),
+        "chip_empty_border": _rgba(255, 255, 255, 0.38),
+        "chip_empty_text": _rgba(228, 240, 255, 0.9),
+        "edit": QColor("#007aff"),
+        "edit_text": QColor("#ffffff"),
+        "delete": QColor("#007aff"),
+        "delete_text": QColor("#ffffff"),
+        "use": QColor("#007aff"),
+        "use_text": QColor("#ffffff"),
+    },
+    "light": {
+        "card": QColor("#ffffff"),
+        "card_border": _rgba(60, 60, 67, 0.12),
+        "title": QColor("#111111"),
+        "meta": _rgba(60, 60, 67, 0.65),
+        "prompt": _rgba(28, 28, 30, 0.82),
+        "chip": _rgba(10, 132, 255, 0.12),
+        "chip_border": _rgba(0, 122, 255, 0.35),
+        "chip_text": QColor("#0a84ff"),
+        "chip_empty_border": _rgba(0, 122, 255, 0.35),
+        "chip_empty_text": _rgba(10, 132, 255, 0.85),
+        "edit": _rgba(255, 149, 0, 0.28),
+        "edit_text": QColor("#c93400"),
+        "delete": QColor("#ff3b30"),
+        "delete_text": QColor("#ffffff"),
+        "use": QColor("#007aff"),
+        "use_text": QColor("#ffffff"),
+    },
+}
+
+
+class PresetListModel(QAbstractListModel):
+    """Listenmodell der Presets mit Suchfilter für die virtualisierte Preset-Liste."""
+
+    PresetIndexRole = Qt.ItemDataRole.UserRole + 1
+    PromptRole = Qt.ItemDataRole.UserRole + 2
+    MetaRole = Qt.ItemDataRole.UserRole + 3
+    ShortcutRole = Qt.ItemDataRole.UserRole + 4
+
+    def __init__(self, resolve_target, parent=None):
+        super().__init__(parent)
+        self._resolve_target = resolve_target
+        self._rows = []
+        self._display = []
+        self._name_lc = []
+        self._prompt_lc = []
+        self._trigrams = None
+        self._visible = []
+        self._filter = ""
+
+    def set_presets(self, presets):
+        """Übernimmt eine neue Preset-Liste (nach Laden/Speichern/Löschen)."""
+        rows = list(presets)
+        old_rows = self._rows
+        changed = [i for i, preset in enumerate(rows)
+                   if i >= len(old_rows) or old_rows[i] != preset]
+        if not changed and len(rows) == len(old_rows):
+            return
+
+        # Unveränderte Presets behalten ihre aufbereiteten Texte
+        display = self._display[:len(rows)]
+        name_lc = self._name_lc[:len(rows)]
+        prompt_lc = self._prompt_lc[:len(rows)]
+        for i in changed:
+            preset = rows[i]
+            entry = self._decorate(preset)
+            # Suchtexte (casefold) einmal pro Laden statt pro Tastendruck
+            entries = (entry, preset["name"].casefold(), preset["prompt"].casefold())
+            if i < len(display):
+                display[i], name_lc[i], prompt_lc[i] = entries
+            else:
+                display.append(entries[0])
+                name_lc.append(entries[1])
+                prompt_lc.append(entries[2])
+
+        self._rows, self._display = rows, display
+        self._name_lc, self._prompt_lc = name_lc, prompt_lc
+        # Trigramm-Index erst bei der ersten längeren Suche aufbauen
+        self._trigrams = None
+        visible = self._filtered_indices()
+        if visible == self._visible:
+            # Gleiche Zeilen sichtbar: nur geänderte Karten neu zeichnen
+            changed_set = set(changed)
+            for row, preset_index in enumerate(visible):
+                if preset_index in changed_set:
+                    model_index = self.index(row)
+                    self.dataChanged.emit(model_index, model_index)
+            return
+        self.beginResetModel()
+        self._visible = visible
+        self.endResetModel()
+
+    def set_filter(self, text: str):
+        """Filtert nach Name oder Prompt, ohne die Presets neu zu laden."""
+        needle = text.casefold()
+        if needle == self._filter:
+            return
+        self._filter = needle
+        visible = self._filtered_indices()
+        if visible == self._visible:
+            # Gleiche Trefferliste: die gezeichneten Zeilen bleiben gültig
+            return
+        self.beginResetModel()
+        self._visible = visible
+        self.endResetModel()
+
+    def _filtered_indices(self):
+        if not self._filter:
+            return list(range(len(self._rows)))
+        # Mehrere Suchbegriffe: jeder muss in Name oder Prompt vorkommen (UND-Verknüpfung)
+        tokens = self._filter.split()
+        if not tokens:
+            return list(range(len(self._rows)))
+        name_lc, prompt_lc = self._name_lc, self._prompt_lc
+        grams = {tok[i:i + 3] for tok in tokens for i in range(len(tok) - 2)}
+        if not grams:
+            candidates = range(len(self._rows))
+        else:
+            # Nur Presets prüfen, die alle Trigramme der Suchbegriffe enthalten
+            if self._trigrams is None:
+                self._trigrams = self._build_trigram_index()
+            postings = [self._trigrams.get(gram) for gram in grams]
+            if not all(postings):
+                return []
+            postings.sort(key=len)
+            candidates = sorted(set.intersection(*postings))
+        if len(tokens) == 1:
+            q = tokens[0]
+            return [i for i in candidates if q in name_lc[i] or q in prompt_lc[i]]
+        return [i for i in candidates
+                if all(tok in name_lc[i] or tok in prompt_lc[i] for tok in tokens)]
+
+    def _build_trigram_index(self):
+        index = {}
+        for i, (name, prompt) in enumerate(zip(self._name_lc, self._prompt_lc)):
+            for text in (name, prompt):
+                for j in range(len(text) - 2):
+                    index.setdefault(text[j:j + 3], set()).add(i)
+        return index
+
+    def _decorate(self, preset):
+        """Bereitet alle Anzeigetexte einer Karte einmal beim Laden vor."""
+        name = preset["name"]
+        display_name = name
+        if len(name) > MAX_PRESET_NAME_LENGTH:
+            display_name = name[:MAX_PRESET_NAME_LENGTH - 1] + "…"
+
+        prompt = preset["prompt"]
+        prompt_preview = prompt
+        if len(prompt) > PROMPT_PREVIEW_LENGTH:
+            prompt_preview = prompt[:PROMPT_PREVIEW_LENGTH].rstrip() + "…"
+
+        provider, model = self._resolve_target(preset)
+        meta_text = provider or preset.get("api_type", "")
+        if model:
+            meta_text = f"{provider} • {model}" if provider else model
+
+        shortcut = preset.get("shortcut")
+        shortcut_display = format_shortcut_for_display(shortcut) if shortcut else ""
+
+        tooltip = None
+        if display_name != name or prompt_preview != prompt:
+            tooltip = f"{name}\n\n{prompt}"
+        return display_name, prompt_preview, f"API: {meta_text}", shortcut_display, tooltip
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._visible):
+            return None
+        preset_index = self._visible[index.row()]
+        display_name, prompt_preview, meta, shortcut_display, tooltip = self._display[preset_index]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return display_name
+        if role == self.PromptRole:
+            return prompt_preview
+        if role == self.MetaRole:
+            return meta
+        if role == self.ShortcutRole:
+            return shortcut_display
+        if role == self.PresetIndexRole:
+            return preset_index
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return tooltip
+        return None
+
+
+class PresetDelegate(QStyledItemDelegate):
+    """Zeichnet eine Preset-Karte direkt mit QPainter, ohne Kind-Widgets pro Zeile."""
+
+    CARD_HEIGHT = 186
+    CARD_MARGIN_X = 8
+    CARD_MARGIN_Y = 8
+    PADDING = 16
+    BUTTON_HEIGHT = 32
+    BUTTON_SPACING = 10
+
+    # Reihenfolge von rechts nach links wie im früheren Karten-Layout
+    BUTTONS = (
+        ("use", "Ausführen", "Preset mit Zwischenablage ausführen"),
+        ("delete", "Löschen", "Preset entfernen"),
+        ("edit", "Bearbeiten", "Preset bearbeiten"),
+    )
+
+    def __init__(self, theme="dark", parent=None):
+        super().__init__(parent)
+        self.set_theme(theme)
+
+        self._title_font = QFont(APP_FONT_FAMILY)
+        self._title_font.setPixelSize(17)
+        self._title_font.setWeight(QFont.Weight.Bold)
+        self._text_font = QFont(APP_FONT_FAMILY)
+        self._text_font.setPixelSize(13)
+        self._button_font = QFont(APP_FONT_FAMILY)
+        self._button_font.setPixelSize(13)
+        self._button_font.setWeight(QFont.Weight.DemiBold)
+        self._chip_font = QFont(APP_FONT_FAMILY)
+        self._chip_font.setFamilies(["JetBrains Mono", "SF Mono", APP_FONT_FAMILY])
+        self._chip_font.setStyleHint(QFont.StyleHint.Monospace)
+        self._chip_font.setPixelSize(13)
+        self._chip_font.setWeight(QFont.Weight.Bold)
+
+        button_metrics = QFontMetrics(self._button_font)
+        self._button_widths = {
+            name: button_metrics.horizontalAdvance(text) + 36 for name, text, _tip in self.BUTTONS
+        }
+        self._tooltips = {name: tip for name, _text, tip in self.BUTTONS}
+        self._chip_metrics = QFontMetrics(self._chip_font)
+        self._btn_rects = {}
+        self._cached_width = None
+        self._text_metrics = QFontMetrics(self._text_font)
+        self._prompt_cache = {}
+
+    def set_theme(self, theme: str):
+        colors = _PRESET_CARD_COLORS.get(theme, _PRESET_CARD_COLORS["dark"])
+        self._colors = colors
+        # Stifte einmal pro Theme statt bei jedem paint() erzeugen
+        self._card_pen = QPen(colors["card_border"], 1)
+        self._chip_pen = QPen(colors["chip_border"], 1)
+        self._chip_empty_pen = QPen(colors["chip_empty_border"], 1, Qt.PenStyle.DashLine)
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.CARD_HEIGHT)
+
+    def _card_rect(self, rect):
+        return rect.adjusted(self.CARD_MARGIN_X, self.CARD_MARGIN_Y, -self.CARD_MARGIN_X, -self.CARD_MARGIN_Y)
+
+    def _chip_text(self, index):
+        return index.data(PresetListModel.ShortcutRole) or "Shortcut festlegen"
+
+    def _ensure_width(self, width):
+        # Layouts gelten nur für eine Breite; beim Ändern der Breite (z.B. Resize) verwerfen
+        if width != self._cached_width:
+            self._cached_width = width
+            self.clear_layout_cache()
+
+    def _local_button_rects(self, width, index):
+        # Layout relativ zur Zeile, zwischengespeichert pro Zeile für die aktuelle Breite
+        self._ensure_width(width)
+        key = index.row()
+        rects = self._btn_rects.get(key)
+        if rects is not None:
+            return rects
+        inner = self._card_rect(QRect(0, 0, width, self.CARD_HEIGHT)).adjusted(
+            self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        top = inner.bottom() - self.BUTTON_HEIGHT + 1
+        rects = {}
+        right = inner.right() + 1
+        for name, _text, _tip in self.BUTTONS:
+            btn_width = self._button_widths[name]
+            rects[name] = QRect(right - btn_width, top, btn_width, self.BUTTON_HEIGHT)
+            right -= btn_width + self.BUTTON_SPACING
+        chip_width = self._chip_metrics.horizontalAdvance(self._chip_text(index)) + 26
+        rects["shortcut"] = QRect(inner.left(), top, min(chip_width, max(0, right - inner.left())), self.BUTTON_HEIGHT)
+        self._btn_rects[key] = rects
+        return rects
+
+    def _prompt_lines(self, prompt, width, index):
+        # Höchstens zwei Zeilen, die zweite mit "…" gekürzt; pro Zeile für die aktuelle Breite
+        # zwischengespeichert (paint() ruft vorher _ensure_width auf)
+        key = index.row()
+        lines = self._prompt_cache.get(key)
+        if lines is not None:
+            return lines
+        layout = QTextLayout(prompt, self._text_font)
+        layout.beginLayout()
+        first = layout.createLine()
+        first.setLineWidth(width)
+        layout.endLayout()
+        first_len = first.textLength() if first.isValid() else len(prompt)
+        lines = [prompt[:first_len].rstrip()]
+        rest = prompt[first_len:].strip()
+        if rest:
+            lines.append(self._text_metrics.elidedText(rest, Qt.TextElideMode.ElideRight, width))
+        self._prompt_cache[key] = lines
+        return lines
+
+    def clear_layout_cache(self):
+        self._btn_rects.clear()
+        self._prompt_cache.clear()
+
+    def button_rects(self, rect, index):
+        """Berechnet die Schaltflächen-Bereiche einer Karte (für Zeichnen und Klicks)."""
+        offset = rect.topLeft()
+        return {name: r.translated(offset) for name, r in self._local_button_rects(rect.width(), index).items()}
+
+    def button_at(self, rect, index, pos):
+        local = pos - rect.topLeft()
+        for name, button_rect in self._local_button_rects(rect.width(), index).items():
+            if button_rect.contains(local):
+                return name
+        return None
+
+    def paint(self, painter, option, index):
+        colors = self._colors
+        self._ensure_width(option.rect.width())
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        card = self._card_rect(option.rect)
+        painter.setPen(self._card_pen)
+        painter.setBrush(colors["card"])
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 18, 18)
+
+        inner = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        # Titel und Meta-Zeile (Texte sind im Modell bereits gekürzt)
+        name = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        painter.setFont(self._title_font)
+        painter.setPen(colors["title"])
+        title_rect = QRect(inner.left(), inner.top(), inner.width(), 24)
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+
+        painter.setFont(self._text_font)
+        painter.setPen(colors["meta"])
+        meta_rect = QRect(inner.left(), title_rect.bottom() + 5, inner.width(), 18)
+        painter.drawText(meta_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         index.data(PresetListModel.MetaRole) or "")
+
+        # Prompt-Vorschau
+        prompt = index.data(PresetListModel.PromptRole) or ""
+        painter.setPen(colors["prompt"])
+        prompt_top = meta_rect.bottom() + 13
+        prompt_rect = QRect(inner.left(), prompt_top, inner.width(),
+                            inner.bottom() - self.BUTTON_HEIGHT - 12 - prompt_top)
+        line_height = self._text_metrics.lineSpacing()
+        for i, line in enumerate(self._prompt_lines(prompt, inner.width(), index)):
+            line_rect = QRect(prompt_rect.left(), prompt_rect.top() + i * line_height, prompt_rect.width(), line_height)
+            painter.drawText(line_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, line)
+
+        # Footer: Shortcut-Chip links, Aktionen rechts
+        rects = self.button_rects(option.rect, index)
+        shortcut_text = index.data(PresetListModel.ShortcutRole)
+        chip = QRectF(rects["shortcut"]).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setFont(self._chip_font)
+        if shortcut_text:
+            painter.setPen(self._chip_pen)
+            painter.setBrush(colors["chip"])
+            painter.drawRoundedRect(chip, 10, 10)
+            painter.setPen(colors["chip_text"])
+        else:
+            painter.setPen(self._chip_empty_pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(chip, 10, 10)
+            painter.setPen(colors["chip_empty_text"])
+        painter.drawText(rects["shortcut"], Qt.AlignmentFlag.AlignCenter, self._chip_text(index))
+
+        painter.setFont(self._button_font)
+        for name, text, _tip in self.BUTTONS:
+            painter.setBrush(colors[name])
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(QRectF(rects[name]), 12, 12)
+            painter.setPen(colors[f"{name}_text"])
+            painter.drawText(rects[name], Qt.AlignmentFlag.AlignCenter, text)
+
+        painter.restore()
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.Type.ToolTip:
+            name = self.button_at(option.rect, index, event.pos())
+            if name == "shortcut":
+                tip = "Shortcut ändern" if index.data(PresetListModel.ShortcutRole) else "Tastenkombination hinzufügen"
+                QToolTip.showText(event.globalPos(), tip, view)
+                return True
+            if name:
+                QToolTip.showText(event.globalPos(), self._tooltips[name], view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
 class HomePage(BasePage):
     """Aufgeräumte HomePage: Liste, Suche, Form zum Erstellen, Result-Panel."""
 
     def __init__(self, parent):
         super().__init__(parent)
+        # Controller-Methoden einmal auflösen statt in jedem Handler per hasattr zu prüfen
+        noop = lambda *args, **kwargs: None
+        self._toast = getattr(self.controller, "show_toast", noop)
+        self._refresh_tray = getattr(self.controller, "refresh_tray_menu", noop)
+        self._reload_shortcuts = getattr(self.controller, "reload_shortcuts", noop)
+        self._register_shortcut = getattr(self.controller, "register_preset_shortcut", None)
 
         self.main_splitter = QSplitter(Qt.Orientation.Horizontal)
 
@@ -1768,11 +2500,11 @@ class HomePage(BasePage):
         header_layout.setSpacing(8)
         title = QLabel("Meine Presets")
         title.setObjectName("section_title")
-        title.setFont(QFont(APP_FONT_FAMILY, 28, QFont.Weight.Bold))
+        title.setFont(_FONT_PAGE_TITLE)
         header_layout.addWidget(title)
         subtitle = QLabel("Erstelle, verwalte und nutze deine API-Prompts")
         subtitle.setObjectName("section_subtitle")
-        subtitle.setFont(QFont(APP_FONT_FAMILY, 14))
+        subtitle.setFont(_FONT_SUBTITLE)
         header_layout.addWidget(subtitle)
         left_layout.addLayout(header_layout)
 
@@ -1801,22 +2533,39 @@ class HomePage(BasePage):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Nach Name oder Prompt suchen...")
         self.search_input.setClearButtonEnabled(True)
-        self.search_input.textChanged.connect(self.filter_presets)
+        self._pending_search = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.search_input.textChanged.connect(self._schedule_filter)
         library_layout.addWidget(self.search_input)
 
-        self.presets_scroll = QScrollArea()
-        self.presets_scroll.setObjectName("preset_scroll")
-        self.presets_scroll.setWidgetResizable(True)
-        self.presets_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self.presets_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        self.presets_container = QWidget()
-        self.presets_layout = QVBoxLayout()
-        self.presets_layout.setSpacing(16)
-        self.presets_layout.setContentsMargins(8, 12, 8, 12)
-        self.presets_container.setLayout(self.presets_layout)
-        self.presets_scroll.setWidget(self.presets_container)
-        library_layout.addWidget(self.presets_scroll, 1)
+        # Virtualisierte Liste: Karten werden vom Delegate gezeichnet statt als Widgets gebaut
+        self.presets_model = PresetListModel(self.resolve_preset_provider_model, self)
+        self.presets_delegate = PresetDelegate(getattr(self.controller, "current_theme", "dark"), self)
+        self.presets_view = QListView()
+        self.presets_view.setObjectName("preset_list")
+        self.presets_view.setModel(self.presets_model)
+        self.presets_view.setItemDelegate(self.presets_delegate)
+        self.presets_model.modelReset.connect(self.presets_delegate.clear_layout_cache)
+        self.presets_model.dataChanged.connect(self.presets_delegate.clear_layout_cache)
+        self.presets_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.presets_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.presets_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.presets_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        # Alle Karten sind gleich hoch: Qt muss sizeHint nicht für jede Zeile abfragen
+        self.presets_view.setUniformItemSizes(True)
+        self.presets_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.presets_view.setBatchSize(32)
+        self.presets_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.presets_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.presets_view.setMouseTracking(True)
+        self.presets_view.viewport().installEventFilter(self)
+        library_layout.addWidget(self.presets_view, 1)
+
+        self.empty_state = self._build_empty_state()
+        library_layout.addWidget(self.empty_state, 1)
 
         left_layout.addWidget(library_card, 1)
         self.main_splitter.addWidget(left_widget)
@@ -1835,7 +2584,7 @@ class HomePage(BasePage):
         form_layout.setSpacing(SECTION_SPACING)
         form_title = QLabel("Neues Preset erstellen")
         form_title.setObjectName("section_title")
-        form_title.setFont(QFont(APP_FONT_FAMILY, 18, QFont.Weight.Bold))
+        form_title.setFont(_FONT_HEADING)
         form_layout.addWidget(form_title)
 
         name_label = QLabel("Preset-Name")
@@ -1894,7 +2643,7 @@ class HomePage(BasePage):
         save_btn = QPushButton("Preset Speichern")
         save_btn.setObjectName("btn_success")
         save_btn.setFixedHeight(44)
-        save_btn.setFont(QFont(APP_FONT_FAMILY, 14, QFont.Weight.Bold))
+        save_btn.setFont(_FONT_SECTION_TITLE)
         save_btn.clicked.connect(self.save_new_preset)
         btn_layout.addWidget(save_btn, 1)
         form_layout.addLayout(btn_layout)
@@ -1908,7 +2657,7 @@ class HomePage(BasePage):
         result_layout.setSpacing(SECTION_SPACING)
         result_header = QLabel("Ergebnis")
         result_header.setObjectName("section_title")
-        result_header.setFont(QFont(APP_FONT_FAMILY, 16, QFont.Weight.Bold))
+        result_header.setFont(_FONT_CARD_TITLE)
         result_layout.addWidget(result_header)
         result_layout.addWidget(create_section_divider())
         self.result_content = QTextEdit()
@@ -1935,54 +2684,43 @@ class HomePage(BasePage):
         self.main_splitter.setSizes([840, 360])
         self.main_layout.addWidget(self.main_splitter)
 
+        self._shortcut_dialog = None
+        self._edit_dialog = None
         self.current_search = ""
+        self._refresh_pending = False
         self.update_presets_list()
     # --- Formular-Validierung ---
     def validate_form(self):
         name = self.preset_name_input.text().strip()
         prompt = self.preset_prompt_input.toPlainText().strip()
 
-        valid = True
-        first_error = ""
-
         if not name:
-            self.name_error_label.setText("Name ist erforderlich")
-            self.name_error_label.show()
-            self.preset_name_input.setProperty("error", True)
-            valid = False
-            first_error = first_error or "Name ist erforderlich"
-        elif len(name) < 3:
-            self.name_error_label.setText("Name muss mindestens 3 Zeichen haben")
-            self.name_error_label.show()
-            self.preset_name_input.setProperty("error", True)
-            valid = False
-            first_error = first_error or "Name muss mindestens 3 Zeichen haben"
+            name_msg = "Name ist erforderlich"
+        elif len(name) < MIN_PRESET_NAME_LENGTH:
+            name_msg = f"Name muss mindestens {MIN_PRESET_NAME_LENGTH} Zeichen haben"
         else:
-            self.name_error_label.hide()
-            self.preset_name_input.setProperty("error", False)
+            name_msg = ""
 
         if not prompt:
-            self.prompt_error_label.setText("Prompt ist erforderlich")
-            self.prompt_error_label.show()
-            self.preset_prompt_input.setProperty("error", True)
-            valid = False
-            first_error = first_error or "Prompt ist erforderlich"
-        elif len(prompt) < 10:
-            self.prompt_error_label.setText("Prompt sollte mindestens 10 Zeichen haben")
-            self.prompt_error_label.show()
-            self.preset_prompt_input.setProperty("error", True)
-            valid = False
-            first_error = first_error or "Prompt sollte mindestens 10 Zeichen haben"
+            prompt_msg = "Prompt ist erforderlich"
+        elif len(prompt) < MIN_PROMPT_LENGTH:
+            prompt_msg = f"Prompt sollte mindestens {MIN_PROMPT_LENGTH} Zeichen haben"
         else:
-            self.prompt_error_label.hide()
-            self.preset_prompt_input.setProperty("error", False)
+            prompt_msg = ""
 
-        self.preset_name_input.style().unpolish(self.preset_name_input)
-        self.preset_name_input.style().polish(self.preset_name_input)
-        self.preset_prompt_input.style().unpolish(self.preset_prompt_input)
-        self.preset_prompt_input.style().polish(self.preset_prompt_input)
+        self._set_field_error(self.preset_name_input, self.name_error_label, name_msg)
+        self._set_field_error(self.preset_prompt_input, self.prompt_error_label, prompt_msg)
 
-        return valid, first_error
+        first_error = name_msg or prompt_msg
+        return not first_error, first_error
+
+    def _set_field_error(self, field, label, message):
+        """Aktualisiert Fehlertext und Fehlerstil nur, wenn sich der Zustand geändert hat."""
+        if label.text() != message:
+            label.setText(message)
+        if label.isHidden() == bool(message):
+            label.setVisible(bool(message))
+        set_style_property(field, "error", bool(message))
 
     def populate_provider_options(self):
         self.provider_models_map = self.controller.backend.provider_models()
@@ -2029,7 +2767,7 @@ class HomePage(BasePage):
             )
         else:
             try:
-                pyperclip.copy(text)
+                write_clipboard(text)
             except Exception:
                 pass
 
@@ -2039,65 +2777,115 @@ class HomePage(BasePage):
 
     # --- Preset-Liste ---
     def update_presets_list(self):
-        # Alle Widgets entfernen
-        while self.presets_layout.count():
-            item = self.presets_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
+        """Lädt die Presets neu ins Modell (nach Speichern, Bearbeiten, Löschen)."""
+        self.presets_model.set_presets(self.controller.presets)
+        self._update_list_state()
 
-        presets = self.controller.presets
-        filtered = [(i, p) for i, p in enumerate(presets) if not self.current_search or
-                    self.current_search.lower() in p["name"].lower() or
-                    self.current_search.lower() in p["prompt"].lower()]
-
-        total = len(filtered)
-        if hasattr(self, 'preset_count_label'):
-            if total == 0:
-                self.preset_count_label.setText("Keine Presets")
-            elif total == 1:
-                self.preset_count_label.setText("1 Preset")
-            else:
-                self.preset_count_label.setText(f"{total} Presets")
-
-        if not filtered:
-            empty = QWidget()
-            empty.setObjectName("empty_state")
-            empty_layout = QVBoxLayout(empty)
-            empty_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_layout.setSpacing(16)
-            empty_title = QLabel("Keine Presets gefunden")
-            empty_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_title.setFont(QFont(APP_FONT_FAMILY, 18, QFont.Weight.Bold))
-            empty_title.setStyleSheet("color: #6c757d;")
-            empty_layout.addWidget(empty_title)
-            empty_text = QLabel("Erstelle dein erstes Preset mit dem Formular")
-            empty_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_text.setObjectName("section_subtitle")
-            empty_layout.addWidget(empty_text)
-            self.presets_layout.addWidget(empty)
-            self.presets_layout.addStretch(1)
+    def _schedule_refresh(self):
+        """Fasst mehrere Änderungen im selben Event-Loop-Durchlauf zu einem Neuladen zusammen."""
+        if self._refresh_pending:
             return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self.update_presets_list()
 
-        for idx, preset in filtered:
-            widget = self.create_preset_widget(idx, preset)
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            widget.setMinimumWidth(260)
-            self.presets_layout.addWidget(widget)
+    def _schedule_filter(self, text: str):
+        # Schnelles Tippen fasst der Timer zu einem einzigen Filterlauf zusammen
+        self._pending_search = text
+        self._filter_timer.start()
 
-        self.presets_layout.addStretch(1)
+    def _apply_filter(self):
+        self.filter_presets(self._pending_search)
 
     def filter_presets(self, text: str):
         """Filtert die Preset-Liste basierend auf der Sucheingabe."""
         self.current_search = text.strip()
-        self.update_presets_list()
+        self.presets_model.set_filter(self.current_search)
+        self._update_list_state()
+
+    def _build_empty_state(self):
+        """Leerzustand der Preset-Liste; wird einmal erstellt und nur ein-/ausgeblendet."""
+        empty = QWidget()
+        empty.setObjectName("empty_state")
+        empty_layout = QVBoxLayout(empty)
+        empty_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        empty_layout.setSpacing(16)
+        empty_title = QLabel("Keine Presets gefunden")
+        empty_title.setObjectName("empty_title")
+        empty_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        empty_title.setFont(_FONT_HEADING)
+        empty_layout.addWidget(empty_title)
+        empty_text = QLabel("Erstelle dein erstes Preset mit dem Formular")
+        empty_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        empty_text.setObjectName("section_subtitle")
+        empty_layout.addWidget(empty_text)
+        empty.hide()
+        return empty
+
+    def _update_list_state(self):
+        total = self.presets_model.rowCount()
+        if total == 0:
+            self.preset_count_label.setText("Keine Presets")
+        elif total == 1:
+            self.preset_count_label.setText("1 Preset")
+        else:
+            self.preset_count_label.setText(f"{total} Presets")
+        has_rows = total > 0
+        if self.presets_view.isVisibleTo(self) != has_rows:
+            # Liste und Leerzustand in einem Schritt tauschen, ohne Zwischenlayout zu zeichnen
+            container = self.presets_view.parentWidget()
+            container.setUpdatesEnabled(False)
+            try:
+                self.presets_view.setVisible(has_rows)
+                self.empty_state.setVisible(not has_rows)
+            finally:
+                container.setUpdatesEnabled(True)
+
+    def set_theme(self, theme: str):
+        self.presets_delegate.set_theme(theme)
+        self.presets_view.viewport().update()
+
+    def eventFilter(self, obj, event):
+        if obj is self.presets_view.viewport():
+            etype = event.type()
+            if etype == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+                pos = event.position().toPoint()
+                index = self.presets_view.indexAt(pos)
+                if index.isValid():
+                    button = self.presets_delegate.button_at(self.presets_view.visualRect(index), index, pos)
+                    if button:
+                        self._on_preset_button(button, index.data(PresetListModel.PresetIndexRole))
+                        return True
+            elif etype == QEvent.Type.MouseMove:
+                pos = event.position().toPoint()
+                index = self.presets_view.indexAt(pos)
+                over_button = index.isValid() and self.presets_delegate.button_at(
+                    self.presets_view.visualRect(index), index, pos) is not None
+                if over_button:
+                    obj.setCursor(Qt.CursorShape.PointingHandCursor)
+                else:
+                    obj.unsetCursor()
+        return super().eventFilter(obj, event)
+
+    def _on_preset_button(self, button, preset_index):
+        if button == "shortcut":
+            self.set_shortcut(preset_index)
+        elif button == "edit":
+            self.edit_preset(preset_index)
+        elif button == "delete":
+            self.delete_preset(preset_index)
+        elif button == "use":
+            self.controller.execute_preset_by_index(preset_index)
 
     def save_new_preset(self):
         """Speichert ein neues Preset über das Backend nach Validierung."""
         is_valid, error_msg = self.validate_form()
         if not is_valid:
-            if hasattr(self.controller, 'show_toast') and error_msg:
-                self.controller.show_toast(error_msg)
+            if error_msg:
+                self._toast(error_msg)
             return
 
         name = self.preset_name_input.text().strip()
@@ -2108,15 +2896,12 @@ class HomePage(BasePage):
 
         success = self.controller.backend.save_preset(name, prompt, api_type, provider, model)
         if success:
-            if hasattr(self.controller, 'show_toast'):
-                self.controller.show_toast(f"Preset '{name}' gespeichert")
+            self._toast(f"Preset '{name}' gespeichert")
             self.clear_form()
-            self.update_presets_list()
-            if hasattr(self.controller, "refresh_tray_menu"):
-                self.controller.refresh_tray_menu()
+            self._schedule_refresh()
+            self._refresh_tray()
         else:
-            if hasattr(self.controller, 'show_toast'):
-                self.controller.show_toast("Fehler: Preset konnte nicht gespeichert werden (evtl. Name bereits vorhanden)")
+            self._toast("Fehler: Preset konnte nicht gespeichert werden (evtl. Name bereits vorhanden)")
 
     def resolve_preset_provider_model(self, preset):
         provider, model = self.controller.backend.resolve_preset_target(preset)
@@ -2124,193 +2909,92 @@ class HomePage(BasePage):
             provider = preset.get("api_type", "")
         return provider, model or ""
 
-    def create_preset_widget(self, index, preset):
-        card = QWidget()
-        card.setObjectName("preset_card")
-        layout = QVBoxLayout(card)
-        layout.setSpacing(12)
-        layout.setContentsMargins(16, 16, 16, 16)
-
-        header = QWidget()
-        header_layout = QHBoxLayout(header)
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        header_layout.setSpacing(8)
-
-        title_box = QWidget()
-        title_layout = QVBoxLayout(title_box)
-        title_layout.setContentsMargins(0, 0, 0, 0)
-        title_layout.setSpacing(4)
-        original_name = preset["name"]
-        display_name = original_name
-        if len(display_name) > MAX_PRESET_NAME_LENGTH:
-            display_name = original_name[:MAX_PRESET_NAME_LENGTH - 1] + "…"
-        title = QLabel(display_name)
-        title.setObjectName("preset_header")
-        if display_name != original_name:
-            title.setToolTip(original_name)
-        title_layout.addWidget(title)
-        provider, model = self.resolve_preset_provider_model(preset)
-        meta_text = provider or preset.get("api_type", "")
-        if model:
-            meta_text = f"{provider} • {model}" if provider else model
-        meta = QLabel(f"API: {meta_text}")
-        meta.setObjectName("preset_meta")
-        title_layout.addWidget(meta)
-        header_layout.addWidget(title_box, 1)
-        layout.addWidget(header)
-
-        prompt = preset["prompt"]
-        truncated_prompt = prompt
-        if len(prompt) > 120:
-            truncated_prompt = prompt[:120].rstrip() + "…"
-
-        prompt_label = QLabel(truncated_prompt)
-        prompt_label.setObjectName("preset_prompt")
-        prompt_label.setWordWrap(True)
-        if truncated_prompt != prompt:
-            prompt_label.setToolTip(prompt)
-        layout.addWidget(prompt_label)
-
-        footer = QWidget()
-        footer_layout = QHBoxLayout(footer)
-        footer_layout.setContentsMargins(0, 0, 0, 0)
-        footer_layout.setSpacing(10)
-
-        shortcut_value = preset.get("shortcut")
-        shortcut_area = QWidget()
-        shortcut_layout = QHBoxLayout(shortcut_area)
-        shortcut_layout.setContentsMargins(0, 0, 0, 0)
-        shortcut_layout.setSpacing(6)
-        if shortcut_value:
-            shortcut_chip = QPushButton(format_shortcut_for_display(shortcut_value))
-            shortcut_chip.setObjectName("shortcut_chip")
-            shortcut_chip.setToolTip("Shortcut ändern")
-            shortcut_chip.clicked.connect(lambda idx=index: self.set_shortcut(idx))
-        else:
-            shortcut_chip = QPushButton("Shortcut festlegen")
-            shortcut_chip.setObjectName("shortcut_chip")
-            shortcut_chip.setProperty("empty", True)
-            shortcut_chip.setToolTip("Tastenkombination hinzufügen")
-            shortcut_chip.clicked.connect(lambda idx=index: self.set_shortcut(idx))
-        shortcut_chip.setFixedHeight(32)
-        shortcut_chip.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
-        shortcut_layout.addWidget(shortcut_chip)
-        shortcut_layout.addStretch()
-        footer_layout.addWidget(shortcut_area, 0)
-
-        footer_layout.addStretch()
-
-        edit_btn = QPushButton("Bearbeiten")
-        edit_btn.setObjectName("btn_warning")
-        edit_btn.setToolTip("Preset bearbeiten")
-        edit_btn.setFixedHeight(32)
-        edit_btn.clicked.connect(lambda idx=index: self.edit_preset(idx))
-        footer_layout.addWidget(edit_btn)
-
-        delete_btn = QPushButton("Löschen")
-        delete_btn.setObjectName("btn_danger")
-        delete_btn.setToolTip("Preset entfernen")
-        delete_btn.setFixedHeight(32)
-        delete_btn.clicked.connect(lambda idx=index: self.delete_preset(idx))
-        footer_layout.addWidget(delete_btn)
-
-        use_btn = QPushButton("Ausführen")
-        use_btn.setObjectName("btn_primary")
-        use_btn.setFixedHeight(32)
-        use_btn.setToolTip("Preset mit Zwischenablage ausführen")
-        use_btn.clicked.connect(lambda idx=index: self.controller.execute_preset_by_index(idx))
-        footer_layout.addWidget(use_btn)
-
-        layout.addWidget(footer)
-
-        return card
-
     def set_shortcut(self, index):
-        dialog = ShortcutDialog(self)
+        if self._shortcut_dialog is None:
+            self._shortcut_dialog = ShortcutDialog(self)
+        else:
+            self._shortcut_dialog.reset()
+        dialog = self._shortcut_dialog
+        controller = self.controller
+        backend = controller.backend
         if dialog.exec() == QDialog.DialogCode.Accepted:
             shortcut = dialog.get_shortcut()
             if shortcut:
-                existing = self.controller.preset_shortcuts.get(shortcut)
+                existing = controller.preset_shortcuts.get(shortcut)
                 if existing is not None and existing != index:
-                    if hasattr(self.controller, 'show_toast'):
-                        if existing < len(self.controller.backend.presets):
-                            name = self.controller.backend.presets[existing]["name"]
-                        else:
-                            name = "Preset"
-                        self.controller.show_toast(f"⚠️ Shortcut bereits vergeben an '{name}'")
+                    name = controller._preset_name(existing)
+                    self._toast(f"⚠️ Shortcut bereits vergeben an '{name}'")
                     return
                 # Persistiere Shortcut im Backend und registriere danach
-                if self.controller.backend.save_preset_shortcut(index, shortcut):
+                if backend.save_preset_shortcut(index, shortcut):
                     # Registrierung im Controller
-                    if hasattr(self.controller, 'register_preset_shortcut'):
-                        success = self.controller.register_preset_shortcut(shortcut, index)
+                    if self._register_shortcut is not None:
+                        success = self._register_shortcut(shortcut, index)
                         if not success:
                             # Revert gespeicherten Shortcut
-                            self.controller.backend.save_preset_shortcut(index, "")
-                            if hasattr(self.controller, 'show_toast'):
-                                self.controller.show_toast("Shortcut konnte nicht registriert werden")
+                            backend.save_preset_shortcut(index, "")
+                            self._toast("Shortcut konnte nicht registriert werden")
                         else:
-                            self.update_presets_list()
+                            self._schedule_refresh()
                 else:
-                    if hasattr(self.controller, 'show_toast'):
-                        self.controller.show_toast("Fehler beim Speichern des Shortcuts")
+                    self._toast("Fehler beim Speichern des Shortcuts")
 
     def edit_preset(self, index):
-        if 0 <= index < len(self.controller.presets):
-            preset = self.controller.presets[index]
+        presets = self.controller.presets
+        if 0 <= index < len(presets):
+            preset = presets[index]
             provider, model = self.resolve_preset_provider_model(preset)
             preset_with_defaults = dict(preset)
             preset_with_defaults.setdefault("provider", provider)
             preset_with_defaults.setdefault("model", model)
-            dialog = EditPresetDialog(self, preset_with_defaults, provider_models=self.provider_models_map)
+            if self._edit_dialog is None:
+                self._edit_dialog = EditPresetDialog(self, preset_with_defaults, provider_models=self.provider_models_map)
+            else:
+                self._edit_dialog.load(preset_with_defaults, self.provider_models_map)
+            dialog = self._edit_dialog
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 data = dialog.get_data()
                 if not data["name"] or not data["prompt"]:
-                    if hasattr(self.controller, 'show_toast'):
-                        self.controller.show_toast("Name und Prompt erforderlich")
+                    self._toast("Name und Prompt erforderlich")
                     return
                 if self.controller.backend.update_preset_by_index(index, data["name"], data["prompt"], data["api_type"], data.get("provider"), data.get("model")):
-                    if hasattr(self.controller, 'show_toast'):
-                        self.controller.show_toast(f"Preset '{data['name']}' aktualisiert")
-                    self.update_presets_list()
-                    if hasattr(self.controller, "refresh_tray_menu"):
-                        self.controller.refresh_tray_menu()
+                    self._toast(f"Preset '{data['name']}' aktualisiert")
+                    self._schedule_refresh()
+                    self._refresh_tray()
                 else:
-                    if hasattr(self.controller, 'show_toast'):
-                        self.controller.show_toast("Fehler beim Aktualisieren")
+                    self._toast("Fehler beim Aktualisieren")
 
     def delete_preset(self, index):
-        if 0 <= index < len(self.controller.presets):
-            p = self.controller.presets[index]
+        presets = self.controller.presets
+        if 0 <= index < len(presets):
+            p = presets[index]
             reply = QMessageBox.question(self, "Preset löschen",
                                          f"Möchtest du das Preset '{p['name']}' wirklich löschen?\n\nDiese Aktion kann nicht rückgängig gemacht werden.",
                                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                                          QMessageBox.StandardButton.No)
             if reply == QMessageBox.StandardButton.Yes:
                 if self.controller.backend.delete_preset_by_index(index):
-                    if hasattr(self.controller, 'show_toast'):
-                        self.controller.show_toast(f"'{p['name']}' gelöscht")
-                    if hasattr(self.controller, 'reload_shortcuts'):
-                        self.controller.reload_shortcuts()
-                    self.update_presets_list()
-                    if hasattr(self.controller, "refresh_tray_menu"):
-                        self.controller.refresh_tray_menu()
+                    self._toast(f"'{p['name']}' gelöscht")
+                    self._reload_shortcuts()
+                    self._schedule_refresh()
+                    self._refresh_tray()
                 else:
-                    if hasattr(self.controller, 'show_toast'):
-                        self.controller.show_toast("Fehler beim Löschen")
+                    self._toast("Fehler beim Löschen")
 
     def clear_form(self):
-        self.preset_name_input.clear()
-        self.preset_prompt_input.clear()
-        self.populate_provider_options()
-        self.name_error_label.hide()
-        self.prompt_error_label.hide()
-        self.preset_name_input.setProperty("error", False)
-        self.preset_prompt_input.setProperty("error", False)
-        self.preset_name_input.style().unpolish(self.preset_name_input)
-        self.preset_name_input.style().polish(self.preset_name_input)
-        self.preset_prompt_input.style().unpolish(self.preset_prompt_input)
-        self.preset_prompt_input.style().polish(self.preset_prompt_input)
+        # Leeren ohne textChanged: sonst würde validate_form kurz Fehler setzen und
+        # beide Felder zweimal neu polieren; Neuzeichnen erst am Ende gesammelt
+        self.setUpdatesEnabled(False)
+        try:
+            for field in (self.preset_name_input, self.preset_prompt_input):
+                field.blockSignals(True)
+                field.clear()
+                field.blockSignals(False)
+            self.populate_provider_options()
+            self._set_field_error(self.preset_name_input, self.name_error_label, "")
+            self._set_field_error(self.preset_prompt_input, self.prompt_error_label, "")
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class CredentialsPage(BasePage):
@@ -2319,12 +3003,12 @@ class CredentialsPage(BasePage):
 
         title = QLabel("API Einstellungen")
         title.setObjectName("section_title")
-        title.setFont(QFont(APP_FONT_FAMILY, 28, QFont.Weight.Bold))
+        title.setFont(_FONT_PAGE_TITLE)
         self.main_layout.addWidget(title)
 
         subtitle = QLabel("Konfiguriere deine API-Zugangsdaten")
         subtitle.setObjectName("section_subtitle")
-        subtitle.setFont(QFont(APP_FONT_FAMILY, 14))
+        subtitle.setFont(_FONT_SUBTITLE)
         self.main_layout.addWidget(subtitle)
 
         # API Key Card
@@ -2361,12 +3045,12 @@ class CredentialsPage(BasePage):
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(CONTROL_SPACING)
 
-        test_btn = QPushButton("Verbindung testen")
-        test_btn.setObjectName("btn_secondary")
-        test_btn.setToolTip("Testet die API-Verbindung")
-        test_btn.setMinimumHeight(44)
-        test_btn.clicked.connect(self.test_api)
-        btn_layout.addWidget(test_btn)
+        self.test_btn = QPushButton("Verbindung testen")
+        self.test_btn.setObjectName("btn_secondary")
+        self.test_btn.setToolTip("Testet die API-Verbindung")
+        self.test_btn.setMinimumHeight(44)
+        self.test_btn.clicked.connect(self.test_api)
+        btn_layout.addWidget(self.test_btn)
 
         save_btn = QPushButton("API-Key speichern")
         save_btn.setObjectName("btn_success")
@@ -2383,6 +3067,7 @@ class CredentialsPage(BasePage):
         self.main_layout.addWidget(api_card)
         self.main_layout.addStretch()
 
+        self._test_task = None
         self.load_credentials()
 
     def load_credentials(self):
@@ -2392,10 +3077,11 @@ class CredentialsPage(BasePage):
         if key:
             self.api_key_input.setText(key)
             self.status_label.setText("API-Key gespeichert")
-            self.status_label.setStyleSheet("color: #3fb950; font-weight: 600;")
+            set_style_property(self.status_label, "status", "ok")
         else:
             self.api_key_input.clear()
             self.status_label.setText("")
+            set_style_property(self.status_label, "status", "")
 
     def save_credentials(self):
         api_key = self.api_key_input.text().strip()
@@ -2407,7 +3093,7 @@ class CredentialsPage(BasePage):
         if self.controller.backend.save_credentials(api_key, provider):
             self.controller.show_toast("API-Key gespeichert")
             self.status_label.setText("Gespeichert")
-            self.status_label.setStyleSheet("color: #3fb950; font-weight: 600;")
+            set_style_property(self.status_label, "status", "ok")
         else:
             self.controller.show_toast("Fehler beim Speichern")
 
@@ -2421,19 +3107,26 @@ class CredentialsPage(BasePage):
         self.controller.backend.save_credentials(api_key, provider)
 
         self.status_label.setText("Teste Verbindung...")
-        self.status_label.setStyleSheet("color: #58a6ff; font-weight: 600;")
-        QApplication.processEvents()
-
-        result = self.controller.backend.test_credential(provider)
-
+        set_style_property(self.status_label, "status", "pending")
+        self.test_btn.setEnabled(False)
+
+        # Netzwerkaufruf im Hintergrund, damit die Oberfläche bedienbar bleibt
+        task = _CredentialTestWorker(self.controller.backend, provider)
+        task.signals.finished.connect(self._on_test_finished)
+        self._test_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_test_finished(self, result):
+        self._test_task = None
+        self.test_btn.setEnabled(True)
         if result.get("status") == "success":
             self.status_label.setText("Verbindung erfolgreich!")
-            self.status_label.setStyleSheet("color: #3fb950; font-weight: 600;")
+            set_style_property(self.status_label, "status", "ok")
             self.controller.show_toast("API-Test erfolgreich")
         else:
             error = result.get("message", "Unbekannter Fehler")
             self.status_label.setText(f"Fehler: {error}")
-            self.status_label.setStyleSheet("color: #f85149; font-weight: 600;")
+            set_style_property(self.status_label, "status", "error")
             self.controller.show_toast("API-Test fehlgeschlagen")
 
 
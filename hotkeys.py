@@ -1,7 +1,8 @@
 """Platform aware global hotkey manager."""
 from __future__ import annotations
 
-from typing import Callable, Dict, Optional
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 
 from backend import get_platform
 
@@ -13,6 +14,38 @@ if get_platform() == "windows":
 else:  # pragma: no cover - hotkeys disabled on non-Windows systems
     keyboard = None  # type: ignore
 
+# Modifier names (lower case) -> pynput tokens
+_MOD_TABLE = {
+    "ctrl": "<ctrl>",
+    "control": "<ctrl>",
+    "alt": "<alt>",
+    "option": "<alt>",
+    "shift": "<shift>",
+    "win": "<cmd>",
+    "meta": "<cmd>",
+    "cmd": "<cmd>",
+    "command": "<cmd>",
+}
+
+
+@lru_cache(maxsize=256)
+def _to_pynput_format(shortcut: str) -> Optional[str]:
+    """Convert a shortcut like 'Ctrl+Alt+K' to pynput's '<ctrl>+<alt>+k' (None if unsupported)."""
+    parts = [p.strip() for p in shortcut.replace("-", "+").split("+") if p.strip()]
+    if len(parts) < 2:
+        return None
+
+    tokens = []
+    for mod in parts[:-1]:
+        token = _MOD_TABLE.get(mod.lower())
+        if token is None:
+            return None
+        tokens.append(token)
+
+    key_token = parts[-1].lower()
+    tokens.append(key_token if len(key_token) == 1 else f"<{key_token}>")
+    return "+".join(tokens)
+
 
 class GlobalHotkeyManager:
     """Simple wrapper around pynput.GlobalHotKeys that only activates on Windows."""
@@ -22,6 +55,8 @@ class GlobalHotkeyManager:
         self._callback = callback
         self._listener: Optional["keyboard.GlobalHotKeys"] = None
         self._shortcut_map: Dict[str, str] = {}
+        # Fingerprint of the map the running listener was built from
+        self._last_fp: Optional[FrozenSet[Tuple[str, str]]] = None
 
     def update_shortcuts(self, shortcut_to_preset: Dict[str, str]) -> None:
         """Replace the currently registered shortcuts."""
@@ -30,12 +65,17 @@ class GlobalHotkeyManager:
             for shortcut, preset in shortcut_to_preset.items()
             if shortcut and preset
         }
+        fp = frozenset(self._shortcut_map.items())
+        if fp == self._last_fp:
+            return
         self._restart_listener()
+        self._last_fp = fp
 
     def stop(self) -> None:
         if self._listener:
             self._listener.stop()
             self._listener = None
+        self._last_fp = None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -51,12 +91,13 @@ class GlobalHotkeyManager:
         if not self._shortcut_map:
             return
 
-        hotkey_actions = {}
-        for shortcut, preset in self._shortcut_map.items():
-            combo = self._to_pynput_format(shortcut)
-            if not combo:
-                continue
-            hotkey_actions[combo] = self._build_callback(preset)
+        hotkey_actions = {
+            combo: self._build_callback(preset)
+            for combo, preset in zip(
+                map(_to_pynput_format, self._shortcut_map), self._shortcut_map.values()
+            )
+            if combo
+        }
 
         if not hotkey_actions:
             return
@@ -69,35 +110,3 @@ class GlobalHotkeyManager:
             self._callback(preset)
 
         return _callback
-
-    @staticmethod
-    def _to_pynput_format(shortcut: str) -> Optional[str]:
-        parts = [p.strip() for p in shortcut.replace("-", "+").split("+") if p.strip()]
-        if not parts:
-            return None
-        modifiers = [p for p in parts[:-1]]
-        key = parts[-1]
-        if not modifiers:
-            return None
-
-        mapped_modifiers = []
-        for mod in modifiers:
-            normalized = mod.lower()
-            if normalized in {"ctrl", "control"}:
-                mapped_modifiers.append("<ctrl>")
-            elif normalized in {"alt", "option"}:
-                mapped_modifiers.append("<alt>")
-            elif normalized == "shift":
-                mapped_modifiers.append("<shift>")
-            elif normalized in {"win", "meta", "cmd", "command"}:
-                mapped_modifiers.append("<cmd>")
-            else:
-                return None
-
-        key_token = key.lower()
-        if len(key_token) == 1:
-            combo_key = key_token
-        else:
-            combo_key = f"<{key_token}>"
-
-        return "+".join(mapped_modifiers + [combo_key])
@@ -4,7 +4,7 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
-from typing import Dict, Set, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
 
 from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QAction, QCursor, QIcon
@@ -45,6 +45,9 @@ class _PresetExecutionTask(QRunnable):
 class MacStatusBarApp(QObject):
     """Encapsulates the macOS status bar experience."""
 
+    # Aufgelöstes Tray-Icon, damit neue Instanzen weder Dateien prüfen noch neu dekodieren
+    _icon_cache: Optional[QIcon] = None
+
     def __init__(self, backend: "APIBackend", window: "PromptPilotWindow"):
         super().__init__(window)
         self._backend = backend
@@ -54,41 +57,72 @@ class MacStatusBarApp(QObject):
 
         self._tray = QSystemTrayIcon(self._load_icon(), self)
         self._menu = QMenu()
+        self._preset_actions: Dict[str, QAction] = {}
+        self._presets_dirty = True
+
+        # Feste Einträge einmal anlegen; Preset-Einträge werden davor eingefügt
+        self._placeholder = QAction("Keine Presets verfügbar", self._menu)
+        self._placeholder.setEnabled(False)
+        self._placeholder.setVisible(False)
+        self._menu.addAction(self._placeholder)
+        self._menu.addSeparator()
+        settings_action = QAction("Einstellungen", self._menu)
+        settings_action.triggered.connect(self._open_settings)
+        quit_action = QAction("Beenden", self._menu)
+        quit_action.triggered.connect(self._quit_application)
+        self._menu.addActions([settings_action, quit_action])
+        # Preset-Einträge erst aufbauen, wenn das Menü tatsächlich geöffnet wird
+        self._menu.aboutToShow.connect(self._populate_menu)
+
         self._tray.setContextMenu(self._menu)
         self._tray.activated.connect(self._handle_activation)
         self._tray.setVisible(True)
 
-        self.update_presets()
-
     @property
     def tray_icon(self) -> QSystemTrayIcon:
         return self._tray
 
     # ------------------------------------------------------------------
     def update_presets(self) -> None:
-        self._menu.clear()
-        presets = list(self._backend.presets)
-        if presets:
-            for preset in presets:
-                action = QAction(preset["name"], self._menu)
-                action.triggered.connect(
-                    lambda _checked=False, name=preset["name"]: self._handle_preset_selection(name)
-                )
-                self._menu.addAction(action)
-        else:
-            placeholder = QAction("Keine Presets verfügbar", self._menu)
-            placeholder.setEnabled(False)
-            self._menu.addAction(placeholder)
+        """Mark the preset entries as stale; they are rebuilt on the next menu open."""
+        self._presets_dirty = True
 
-        self._menu.addSeparator()
-
-        settings_action = QAction("Einstellungen", self._menu)
-        settings_action.triggered.connect(self._open_settings)
-        self._menu.addAction(settings_action)
-
-        quit_action = QAction("Beenden", self._menu)
-        quit_action.triggered.connect(self._quit_application)
-        self._menu.addAction(quit_action)
+    def _populate_menu(self) -> None:
+        if not self._presets_dirty:
+            return
+        self._presets_dirty = False
+
+        # Bestehende QActions nach Namen wiederverwenden; nur neue Namen erzeugen
+        previous = self._preset_actions
+        actions: Dict[str, QAction] = {}
+        ordered: List[QAction] = []
+        for preset in self._backend.presets:
+            name = preset["name"]
+            if name in actions:
+                continue
+            action = previous.pop(name, None)
+            if action is None:
+                action = QAction(name, self._menu)
+                action.setData(name)
+                action.triggered.connect(self._on_preset_action)
+            actions[name] = action
+            ordered.append(action)
+
+        for action in previous.values():
+            self._menu.removeAction(action)
+            action.deleteLater()
+        self._preset_actions = actions
+
+        self._placeholder.setVisible(not ordered)
+        current = self._menu.actions()[:len(ordered)]
+        if current != ordered:
+            self._menu.insertActions(self._placeholder, ordered)
+
+    def _on_preset_action(self) -> None:
+        # Ein gemeinsamer Slot für alle Preset-Einträge; der Name steckt in QAction.data()
+        action = self.sender()
+        if isinstance(action, QAction):
+            self._handle_preset_selection(action.data())
 
     # ------------------------------------------------------------------
     def _handle_preset_selection(self, preset_name: str) -> None:
@@ -160,11 +194,15 @@ class MacStatusBarApp(QObject):
             self._menu.popup(QCursor.pos())
 
     def _load_icon(self) -> QIcon:
+        cached = MacStatusBarApp._icon_cache
+        if cached is not None:
+            return cached
         for icon_name in ("promtpilot_icon.icns", "promtpilot_icon.png", "icon.icns", "icon.png"):
             icon_path = resource_path(icon_name)
             if os.path.exists(icon_path):
                 icon = QIcon(icon_path)
                 if not icon.isNull():
+                    MacStatusBarApp._icon_cache = icon
                     return icon
         app = QApplication.instance()
         if app and not app.windowIcon().isNull():